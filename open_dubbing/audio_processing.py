@@ -16,20 +16,25 @@
 import os
 import warnings
 
-from typing import Final, Mapping, Sequence
+from typing import Final, Iterable, Iterator, Mapping, Sequence
 
 import numpy as np
 import torch
 
-from moviepy import AudioFileClip
 from pyannote.audio import Pipeline
 from pydub import AudioSegment
 
 from open_dubbing import logger
+from open_dubbing.ffmpeg import FFmpeg
 
 _DEFAULT_DUBBED_VOCALS_AUDIO_FILE: Final[str] = "dubbed_vocals.mp3"
 _DEFAULT_DUBBED_AUDIO_FILE: Final[str] = "dubbed_audio"
 _DEFAULT_OUTPUT_FORMAT: Final[str] = ".mp3"
+# Only signed widths, 8 bits samples are unsigned and 24 bits have no NumPy type
+_SAMPLE_WIDTH_DTYPES: Final[Mapping[int, type]] = {
+    2: np.int16,
+    4: np.int32,
+}
 
 
 def create_pyannote_timestamps(
@@ -37,9 +42,14 @@ def create_pyannote_timestamps(
     audio_file: str,
     pipeline: Pipeline,
     device: str = "cpu",
+    trim_silence: bool = False,
 ) -> Sequence[Mapping[str, float]]:
     """Creates timestamps from a vocals file using Pyannote speaker diarization.
 
+    If trim_silence is set, the long silent regions detected by energy_vad are
+    removed before the diarization and the timestamps are mapped back to the
+    original audio.
+
     Returns:
         A list of dictionaries containing start and end timestamps for each
         speaker segment.
@@ -48,14 +58,157 @@ def create_pyannote_timestamps(
         warnings.filterwarnings("ignore", category=UserWarning)
         if device == "cuda":
             pipeline.to(torch.device("cuda"))
-        diarization = pipeline(audio_file)
+
+        if not trim_silence:
+            diarization = pipeline(audio_file)
+            return [
+                {"start": segment.start, "end": segment.end, "speaker_id": speaker}
+                for segment, _, speaker in diarization.itertracks(yield_label=True)
+            ]
+
+        samples, sample_rate = _load_mono_samples(audio_file)
+        regions = _get_speech_regions(samples=samples, sample_rate=sample_rate)
+        if len(regions) == 0:
+            return []
+
+        chunks = [
+            samples[int(start * sample_rate) : int(end * sample_rate)]
+            for start, end in regions
+        ]
+        waveform = torch.from_numpy(np.concatenate(chunks)).unsqueeze(0)
+        diarization = pipeline({"waveform": waveform, "sample_rate": sample_rate})
+
+        # Start of each region in the trimmed audio, used to map back the times
+        trimmed_starts = np.cumsum([0.0] + [end - start for start, end in regions])
+
+        # A time on the boundary between two regions is mapped to the start of
+        # the next region for segment starts (side "right") and to the end of
+        # the previous one for segment ends (side "left")
+        def _to_original_time(time: float, side: str) -> float:
+            idx = int(np.searchsorted(trimmed_starts, time, side=side)) - 1
+            idx = min(max(idx, 0), len(regions) - 1)
+            start, end = regions[idx]
+            return min(start + time - trimmed_starts[idx], end)
+
         utterance_metadata = [
-            {"start": segment.start, "end": segment.end, "speaker_id": speaker}
+            {
+                "start": _to_original_time(segment.start, "right"),
+                "end": _to_original_time(segment.end, "left"),
+                "speaker_id": speaker,
+            }
             for segment, _, speaker in diarization.itertracks(yield_label=True)
         ]
+        logger().debug(
+            f"create_pyannote_timestamps. Diarized {trimmed_starts[-1]:.2f} secs of {len(samples) / sample_rate:.2f} secs"
+        )
         return utterance_metadata
 
 
+def _load_mono_samples(audio_file: str, sample_rate: int = 16000):
+    """Returns the samples of an audio file as mono float32 in [-1, 1] and its sample rate."""
+    audio = AudioSegment.from_file(audio_file)
+    audio = audio.set_channels(1).set_frame_rate(sample_rate).set_sample_width(2)
+    samples = np.frombuffer(audio.raw_data, dtype=np.int16).astype(np.float32)
+    return samples / 32768.0, sample_rate
+
+
+def _get_speech_regions(
+    *,
+    samples: np.ndarray,
+    sample_rate: int,
+    silence_threshold_db: float = -35.0,
+    min_silence: float = 1.5,
+    frame_ms: int = 10,
+) -> Sequence[tuple[float, float]]:
+    frame_size = sample_rate * frame_ms // 1000
+    num_frames = len(samples) // frame_size
+    if num_frames == 0:
+        return []
+
+    # RMS energy of each frame computed in a single vectorized pass
+    frames = samples[: num_frames * frame_size].reshape(num_frames, frame_size)
+    rms = np.sqrt(np.mean(np.square(frames, dtype=np.float32), axis=1))
+    voiced = 20 * np.log10(rms + 1e-10) > silence_threshold_db
+
+    # Indexes where runs of voiced frames start and end
+    edges = np.diff(np.concatenate(([0], voiced.astype(np.int8), [0])))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+
+    # Silences shorter than min_silence are kept as part of the speech
+    min_silence_frames = int(min_silence * 1000 / frame_ms)
+    regions = []
+    for start, end in zip(starts, ends):
+        if regions and start - regions[-1][1] < min_silence_frames:
+            regions[-1][1] = end
+        else:
+            regions.append([start, end])
+
+    duration = len(samples) / sample_rate
+    frame_secs = frame_ms / 1000
+    return [
+        (start * frame_secs, duration if end == num_frames else end * frame_secs)
+        for start, end in regions
+    ]
+
+
+def energy_vad(
+    *,
+    audio_file: str,
+    silence_threshold_db: float = -35.0,
+    min_silence: float = 1.5,
+) -> Sequence[tuple[float, float]]:
+    """Detects the regions of an audio file that are not silent.
+
+    A frame of 10 ms is silent when its RMS energy is below silence_threshold_db
+    (dBFS). Silences shorter than min_silence seconds are kept.
+
+    Returns:
+        A list of (start, end) tuples in seconds.
+    """
+    samples, sample_rate = _load_mono_samples(audio_file)
+    return _get_speech_regions(
+        samples=samples,
+        sample_rate=sample_rate,
+        silence_threshold_db=silence_threshold_db,
+        min_silence=min_silence,
+    )
+
+
+def pack_utterances(
+    *,
+    utterance_metadata: Sequence[Mapping[str, float | str]],
+    max_window: float = 30.0,
+    gap: float = 1.0,
+    min_duration: float = 0.0,
+) -> Sequence[Sequence[int]]:
+    """Groups consecutive utterances that fit together in a window of max_window secs.
+
+    The duration of a group includes a silence of gap secs after each utterance.
+    Utterances shorter than min_duration or longer than max_window are always
+    in a group of their own.
+
+    Returns:
+        A list of groups with the indexes of the utterances in each group.
+    """
+    groups = []
+    group_duration = 0.0
+    previous_packable = False
+    for idx, utterance in enumerate(utterance_metadata):
+        duration = utterance["end"] - utterance["start"] + gap
+        packable = min_duration <= duration - gap and duration <= max_window
+        if packable and previous_packable and group_duration + duration <= max_window:
+            groups[-1].append(idx)
+            group_duration += duration
+        else:
+            groups.append([idx])
+            group_duration = duration
+
+        previous_packable = packable
+
+    return groups
+
+
 def _cut_and_save_audio(
     *,
     audio: AudioSegment,
@@ -100,23 +253,101 @@ def run_cut_and_save_audio(
         the original start and end times.
     """
 
-    audio = AudioSegment.from_file(audio_file)
     key = "path"
     prefix = "chunk"
+    cuts = []
     updated_utterance_metadata = []
     for utterance in utterance_metadata:
-        chunk_path = _cut_and_save_audio(
-            audio=audio,
-            utterance=utterance,
-            prefix=prefix,
-            output_directory=output_directory,
-        )
+        start_time_ms = int(utterance["start"] * 1000)
+        end_time_ms = int(utterance["end"] * 1000)
+        chunk_filename = f"{prefix}_{utterance['start']}_{utterance['end']}.mp3"
+        chunk_path = os.path.join(output_directory, chunk_filename)
+        cuts.append((start_time_ms / 1000, end_time_ms / 1000, chunk_path))
         utterance_copy = utterance.copy()
         utterance_copy[key] = chunk_path
         updated_utterance_metadata.append(utterance_copy)
+
+    FFmpeg().cut_audio(source=audio_file, cuts=cuts)
     return updated_utterance_metadata
 
 
+def _mix_audio_chunks(
+    *, duration: float, chunks: Iterable[tuple[int, AudioSegment]]
+) -> AudioSegment:
+    """Returns silence of duration ms with each chunk added at its position in ms.
+
+    The chunks are consumed one at a time and their samples summed into a
+    single buffer that is clipped to the range of the sample type once at the
+    end, instead of creating a copy of the whole output audio for every chunk.
+    The format and length of the output match overlaying the chunks with pydub.
+    Where chunks do not overlap the samples are also the same, but where
+    overlapping chunks saturate the result differs since pydub clips after
+    each overlay.
+    """
+    output_audio = AudioSegment.silent(duration=duration)
+    mixed = None
+    for position, chunk in chunks:
+        channels = max(output_audio.channels, chunk.channels)
+        frame_rate = max(output_audio.frame_rate, chunk.frame_rate)
+        sample_width = max(output_audio.sample_width, chunk.sample_width)
+        # There is no NumPy type for 24 bits samples
+        if sample_width == 3:
+            sample_width = 4
+
+        if mixed is None or (channels, frame_rate, sample_width) != (
+            output_audio.channels,
+            output_audio.frame_rate,
+            output_audio.sample_width,
+        ):
+            # A chunk with a higher quality format converts what has been
+            # mixed so far, like pydub does when overlaying it
+            if mixed is not None:
+                output_audio = _mixed_to_audio_segment(mixed, output_audio)
+            output_audio = (
+                output_audio.set_channels(channels)
+                .set_frame_rate(frame_rate)
+                .set_sample_width(sample_width)
+            )
+            # Sum in a type wide enough to not overflow before clipping
+            accumulator = np.int32 if sample_width == 2 else np.int64
+            mixed = np.frombuffer(
+                output_audio.raw_data, dtype=_SAMPLE_WIDTH_DTYPES[sample_width]
+            ).astype(accumulator)
+            # Like pydub, the length after the resampling is rounded to whole ms
+            num_frames = int(output_audio.frame_count(ms=len(output_audio)))
+            mixed.resize(num_frames * channels, refcheck=False)
+
+        chunk = (
+            chunk.set_channels(channels)
+            .set_frame_rate(frame_rate)
+            .set_sample_width(sample_width)
+        )
+        samples = np.frombuffer(
+            chunk.raw_data, dtype=_SAMPLE_WIDTH_DTYPES[sample_width]
+        )
+        frame = int(output_audio.frame_count(ms=min(position, len(output_audio))))
+        start = frame * channels
+        end = min(start + len(samples), len(mixed))
+        mixed[start:end] += samples[: end - start]
+
+    if mixed is None:
+        return output_audio
+    return _mixed_to_audio_segment(mixed, output_audio)
+
+
+def _mixed_to_audio_segment(mixed: np.ndarray, audio: AudioSegment) -> AudioSegment:
+    """Clips the summed samples and returns them in the format of audio."""
+    dtype = _SAMPLE_WIDTH_DTYPES[audio.sample_width]
+    limits = np.iinfo(dtype)
+    np.clip(mixed, limits.min, limits.max, out=mixed)
+    return AudioSegment(
+        data=mixed.astype(dtype).tobytes(),
+        sample_width=audio.sample_width,
+        frame_rate=audio.frame_rate,
+        channels=audio.channels,
+    )
+
+
 def insert_audio_at_timestamps(
     *,
     utterance_metadata: Sequence[Mapping[str, str | float]],
@@ -126,34 +357,36 @@ def insert_audio_at_timestamps(
     """Inserts audio chunks into a background audio track at specified timestamps."""
     background_audio = AudioSegment.from_mp3(background_audio_file)
     total_duration = background_audio.duration_seconds
-    output_audio = AudioSegment.silent(duration=total_duration * 1000)
-    for item in utterance_metadata:
-        _file = ""
-        try:
-            for_dubbing = item["for_dubbing"]
-            _file = item["dubbed_path"]
-
-            if for_dubbing is False:
+
+    # Decoded lazily so that only one chunk is in memory while mixing
+    def _chunks() -> Iterator[tuple[int, AudioSegment]]:
+        for item in utterance_metadata:
+            _file = ""
+            try:
+                for_dubbing = item["for_dubbing"]
+                _file = item["dubbed_path"]
+
+                if for_dubbing is False:
+                    start = int(item["start"])
+                    end = int(item["end"])
+                    logger().debug(
+                        f"insert_audio_at_timestamps. Skipping {_file} at start time {start} and end at {end}"
+                    )
+                    continue
+
+                start_time = int(item["start"] * 1000)
+                logger().debug(f"insert_audio_at_timestamps. Open: {_file}")
+                chunk = AudioSegment.from_mp3(_file)
+            except Exception as e:
                 start = int(item["start"])
                 end = int(item["end"])
-                logger().debug(
-                    f"insert_audio_at_timestamps. Skipping {_file} at start time {start} and end at {end}"
+                logger().error(
+                    f"insert_audio_at_timestamps. Error on file: {_file} at start time {start} and end at {end}, error: {e}"
                 )
                 continue
+            yield start_time, chunk
 
-            start_time = int(item["start"] * 1000)
-            logger().debug(f"insert_audio_at_timestamps. Open: {_file}")
-            audio_chunk = AudioSegment.from_mp3(_file)
-            output_audio = output_audio.overlay(
-                audio_chunk, position=start_time, loop=False
-            )
-        except Exception as e:
-            start = int(item["start"])
-            end = int(item["end"])
-            logger().error(
-                f"insert_audio_at_timestamps. Error on file: {_file} at start time {start} and end at {end}, error: {e}"
-            )
-
+    output_audio = _mix_audio_chunks(duration=total_duration * 1000, chunks=_chunks())
     dubbed_vocals_audio_file = os.path.join(
         output_directory, _DEFAULT_DUBBED_VOCALS_AUDIO_FILE
     )
@@ -165,23 +398,17 @@ def _needs_background_normalization(
     *, background_audio_file: str, threshold: float = 0.1
 ):
     try:
-        chunk_size = 1024
-        fps = 44100
-
-        clip = AudioFileClip(background_audio_file)
-        duration = clip.duration
-        num_chunks = int(duration * fps / chunk_size)
-
-        max_amplitude = 0
-
-        for i in range(num_chunks):
-            start = i * chunk_size / fps
-            end = (i + 1) * chunk_size / fps
-            audio_chunk = clip.subclipped(start, end).to_soundarray(fps=fps)
+        audio = AudioSegment.from_file(background_audio_file)
+        if audio.sample_width not in _SAMPLE_WIDTH_DTYPES:
+            audio = audio.set_sample_width(2)
+        samples = np.frombuffer(
+            audio.raw_data, dtype=_SAMPLE_WIDTH_DTYPES[audio.sample_width]
+        )
 
-            # Calculate maximum amplitude of this chunk
-            chunk_amplitude = np.abs(audio_chunk).max(axis=1).max()
-            max_amplitude = max(max_amplitude, chunk_amplitude)
+        # Vectorized reductions over the raw samples. Using min and max avoids
+        # np.abs, which overflows for the most negative value (e.g. -32768)
+        peak = max(int(samples.max()), -int(samples.min())) if samples.size else 0
+        max_amplitude = peak / float(2 ** (8 * audio.sample_width - 1))
 
         needs = max_amplitude > threshold
         logger().debug(
@@ -193,9 +420,6 @@ def _needs_background_normalization(
         logger().error(f"_needs_background_normalization. Error: {e}")
         return True, 1.0
 
-    finally:
-        clip.close()
-
 
 def merge_background_and_vocals(
     *,
@@ -80,6 +80,12 @@ class CommandLine:
                 "'api': Implements a user defined TTS API contract to enable non supported TTS.\n"
             ),
         )
+        parser.add_argument(
+            "--tts_concurrency",
+            type=int,
+            default=3,
+            help="Number of utterances synthesized in parallel when using a network based TTS ('edge', 'api' or 'openai')",
+        )
         parser.add_argument(
             "--openai_api_key",
             default=None,
@@ -102,6 +108,39 @@ class CommandLine:
             action="store_true",
             help="Enable VAD filter when using faster-whisper (reduces hallucinations).",
         )
+        parser.add_argument(
+            "--pack_utterances",
+            action="store_true",
+            help="Transcribe consecutive short utterances together in a single window of up to 30 seconds when using faster-whisper (faster when there are many short utterances).",
+        )
+        parser.add_argument(
+            "--trim_silence",
+            action="store_true",
+            help="Skip the long silences, detected by their energy, before the speaker diarization (faster for audios with long silent parts).",
+        )
+        parser.add_argument(
+            "--batch_size",
+            type=int,
+            default=1,
+            help="Number of 30 seconds windows of an utterance transcribed in parallel when using faster-whisper. Only speeds up utterances longer than 30 seconds. 1 disables batching.",
+        )
+
+        parser.add_argument(
+            "--compute_type",
+            type=str,
+            default=None,
+            choices=[
+                "int8",
+                "int8_float16",
+                "int8_bfloat16",
+                "int8_float32",
+                "int16",
+                "float16",
+                "bfloat16",
+                "float32",
+            ],
+            help="Quantization used by faster-whisper. If not specified uses 'int8_float16' for cuda and 'int8' for cpu.",
+        )
 
         parser.add_argument(
             "--translator",
@@ -134,6 +173,11 @@ class CommandLine:
             default=0,
             help="number of threads used for CPU inference (if is not specified uses defaults for each framework)",
         )
+        parser.add_argument(
+            "--fast_load",
+            action="store_true",
+            help="Load the transformers models (NLLB and Whisper) directly into the device without an intermediate copy in CPU memory. Requires 'pip install open-dubbing[fast_load]'.",
+        )
         parser.add_argument(
             "--clean-intermediate-files",
             action="store_true",
@@ -181,6 +225,18 @@ class CommandLine:
             default="",
             help=("TTS api server URL when using the 'API' tts"),
         )
+        parser.add_argument(
+            "--hf_cache",
+            type=str,
+            default="",
+            help="Directory used to store the models downloaded from Hugging Face (sets HF_HOME). Useful to place them in a fast scratch disk.",
+        )
+        parser.add_argument(
+            "--fast_cache_dir",
+            type=str,
+            default="",
+            help="Directory where a copy of the NLLB model is stored in safetensors format to load it faster in the next executions. Not used if not specified.",
+        )
         parser.add_argument(
             "--update",
             action="store_true",
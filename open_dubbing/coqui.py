@@ -25,6 +25,7 @@ class Coqui:
         language_models = self._build_list_language_model()
         self.language_model = self._select_model_per_language(language_models)
         self.device = device
+        self._tts = {}
 
     @property
     def languages_model(self):
@@ -91,7 +92,11 @@ class Coqui:
         self, input_text, language, file_path, voice=None, audio_config=None
     ):
         model = self.language_model[language]
-        tts = TTS(model).to(self.device)
+        # Loaded once per model and reused for all the utterances
+        if model not in self._tts:
+            self._tts[model] = TTS(model).to(self.device)
+
+        tts = self._tts[model]
         tts.tts_to_file(
             text=input_text, speaker=voice, split_sentences=False, file_path=file_path
         )
@@ -16,15 +16,16 @@ import dataclasses
 import functools
 import logging
 import os
+import queue
 import re
 import shutil
 import sys
+import threading
 import time
 
 from typing import Final
 
 import psutil
-import torch
 
 from pyannote.audio import Pipeline
 
@@ -42,6 +43,7 @@ from open_dubbing.video_processing import VideoProcessing
 
 _DEFAULT_PYANNOTE_MODEL: Final[str] = "pyannote/speaker-diarization-3.1"
 _NUMBER_OF_STEPS: Final[int] = 7
+_PIPELINE_QUEUE_SIZE: Final[int] = 4
 
 
 @dataclasses.dataclass
@@ -103,10 +105,10 @@ class Dubber:
         translation: Translation,
         stt: SpeechToText,
         device: str,
-        cpu_threads: int = 0,
         clean_intermediate_files: bool = False,
         original_subtitles: bool = False,
         dubbed_subtitles: bool = False,
+        trim_silence: bool = False,
     ) -> None:
         self._input_file = input_file
         self.output_directory = output_directory
@@ -121,14 +123,11 @@ class Dubber:
         self.translation = translation
         self.stt = stt
         self.device = device
-        self.cpu_threads = cpu_threads
         self.clean_intermediate_files = clean_intermediate_files
         self.preprocessing_output = None
         self.original_subtitles = original_subtitles
         self.dubbed_subtitles = dubbed_subtitles
-
-        if cpu_threads > 0:
-            torch.set_num_threads(cpu_threads)
+        self.trim_silence = trim_silence
 
     @functools.cached_property
     def input_file(self):
@@ -207,6 +206,7 @@ class Dubber:
             audio_file=audio_file,
             pipeline=self.pyannote_pipeline,
             device=self.device,
+            trim_silence=self.trim_silence,
         )
         utterance_metadata = audio_processing.run_cut_and_save_audio(
             utterance_metadata=utterance_metadata,
@@ -221,44 +221,80 @@ class Dubber:
             audio_background_file=audio_background_file,
         )
 
-    def run_speech_to_text(self) -> None:
-        """Transcribes audio, applies speaker diarization, and updates metadata with Gemini.
-
-        Returns:
-            Updated utterance metadata with speaker information and transcriptions.
-        """
-
+    def _add_speaker_info(self, utterance_metadata):
         media_file = (
             self.preprocessing_output.video_file
             if self.preprocessing_output.video_file
             else self.preprocessing_output.audio_file
         )
-        utterance_metadata = self.stt.transcribe_audio_chunks(
-            utterance_metadata=self.utterance_metadata,
-            source_language=self.source_language,
-            no_dubbing_phrases=[],
-        )
         speaker_info = self.stt.predict_gender(
             file=media_file,
             utterance_metadata=utterance_metadata,
         )
-        self.utterance_metadata = self.stt.add_speaker_info(
+        return self.stt.add_speaker_info(
             utterance_metadata=utterance_metadata, speaker_info=speaker_info
         )
 
-        utterance = Utterance(self.target_language, self.output_directory)
-        self.utterance_metadata = utterance.get_without_empty_blocks(
-            self.utterance_metadata
-        )
-
-    def run_translation(self) -> None:
-        """Translates transcribed text and potentially merges utterances"""
+    def run_speech_to_text_and_translation(self) -> None:
+        """Transcribes and translates the utterances overlapping both tasks.
 
-        self.utterance_metadata = self.translation.translate_utterances(
-            utterance_metadata=self.utterance_metadata,
-            source_language=self.source_language,
-            target_language=self.target_language,
-        )
+        Transcription runs in a worker thread that hands over each utterance
+        through a bounded queue, so an utterance is translated while the next
+        one is being transcribed.
+        """
+        transcribed = queue.Queue(maxsize=_PIPELINE_QUEUE_SIZE)
+        stop = threading.Event()
+        errors = []
+
+        def _transcribe():
+            try:
+                for item in self.stt.iter_transcribed_audio_chunks(
+                    utterance_metadata=self.utterance_metadata,
+                    source_language=self.source_language,
+                    no_dubbing_phrases=[],
+                ):
+                    if stop.is_set():
+                        break
+                    transcribed.put(item)
+            except Exception as e:
+                errors.append(e)
+            finally:
+                transcribed.put(None)
+
+        worker = threading.Thread(target=_transcribe, daemon=True)
+        worker.start()
+
+        utterance_metadata = []
+        translations = []
+        try:
+            while (item := transcribed.get()) is not None:
+                utterance_metadata.append(item)
+                translations.append(
+                    self.translation.translate_text(
+                        text=item["text"],
+                        source_language=self.source_language,
+                        target_language=self.target_language,
+                    )
+                )
+        except BaseException:
+            # Stops the worker, draining the queue in case it is blocked on put
+            stop.set()
+            while transcribed.get() is not None:
+                pass
+            raise
+        finally:
+            worker.join()
+
+        if errors:
+            raise errors[0]
+
+        utterance_metadata = self._add_speaker_info(utterance_metadata)
+        utterance_metadata = [
+            {**item, "translated_text": translation}
+            for item, translation in zip(utterance_metadata, translations)
+        ]
+        utterance = Utterance(self.target_language, self.output_directory)
+        self.utterance_metadata = utterance.get_without_empty_blocks(utterance_metadata)
 
     def run_configure_text_to_speech(self) -> None:
         """Configures the Text-To-Speech process.
@@ -372,7 +408,7 @@ class Dubber:
                 f"Unable to read metadata at '{self.output_directory}. "
                 f"Cannot find a previous execution to update. Error: '{e}'"
             )
-            exit(ExitCode.UPDATE_MISSING_FILES)
+            sys.exit(int(ExitCode.UPDATE_MISSING_FILES))
 
         _, dubbed_paths = utterance.get_files_paths(self.utterance_metadata)
         for path in dubbed_paths:
@@ -380,7 +416,7 @@ class Dubber:
                 logger().error(
                     f"Cannot do update operation since file '{path}' is missing."
                 )
-                exit(ExitCode.UPDATE_MISSING_FILES)
+                sys.exit(int(ExitCode.UPDATE_MISSING_FILES))
 
         # Update voices in case voices, text or time has changed
         modified_utterances = utterance.get_modified_utterances(self.utterance_metadata)
@@ -478,17 +514,11 @@ class Dubber:
         times["preprocessing"] = self.log_debug_task_and_getime(
             "Preprocessing completed", task_start_time
         )
-        logger().info("Speech to text...")
+        logger().info("Speech to text and translation...")
         task_start_time = time.time()
-        self.run_speech_to_text()
-        times["stt"] = self.log_debug_task_and_getime(
-            "Speech to text completed", task_start_time
-        )
-        task_start_time = time.time()
-
-        self.run_translation()
-        times["translation"] = self.log_debug_task_and_getime(
-            "Translation completed", task_start_time
+        self.run_speech_to_text_and_translation()
+        times["stt and translation"] = self.log_debug_task_and_getime(
+            "Speech to text and translation completed", task_start_time
         )
 
         task_start_time = time.time()
@@ -30,3 +30,4 @@ class ExitCode(IntEnum):
     UPDATE_MISSING_FILES = 111
     NO_OPENAI_TTS = 112
     NO_OPENAI_KEY = 113
+    NO_ACCELERATE = 114
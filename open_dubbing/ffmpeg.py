@@ -17,10 +17,13 @@ import shutil
 import subprocess
 import tempfile
 
-from typing import List
+from typing import Final, List, Tuple
 
 from open_dubbing import logger
 
+# Keeps the filter graph well below the command line length limits
+_MAX_CUTS_PER_COMMAND: Final[int] = 100
+
 
 class FFmpeg:
 
@@ -48,6 +51,34 @@ class FFmpeg:
         ]
         FFmpeg()._run(command=cmd)
 
+    def cut_audio(self, *, source: str, cuts: List[Tuple[float, float, str]]):
+        """Cuts several segments (start, end, target) from an audio file.
+
+        All the segments are cut by a single ffmpeg process that decodes the
+        source only once, instead of running a process per segment.
+        """
+        for idx in range(0, len(cuts), _MAX_CUTS_PER_COMMAND):
+            batch = cuts[idx : idx + _MAX_CUTS_PER_COMMAND]
+            splits = "".join(f"[s{i}]" for i in range(len(batch)))
+            filters = [f"[0:a]asplit={len(batch)}{splits}"]
+            outputs = []
+            for i, (start, end, target) in enumerate(batch):
+                filters.append(
+                    f"[s{i}]atrim=start={start}:end={end},asetpts=PTS-STARTPTS[o{i}]"
+                )
+                outputs.extend(["-map", f"[o{i}]", target])
+
+            cmd = [
+                "ffmpeg",
+                "-hide_banner",
+                "-y",
+                "-i",
+                source,
+                "-filter_complex",
+                ";".join(filters),
+            ] + outputs
+            self._run(command=cmd)
+
     def remove_silence(self, *, filename: str):
         tmp_filename = ""
         with tempfile.NamedTemporaryFile(delete=False) as temp_file:
@@ -12,33 +12,56 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import functools
 import logging
 import os
 import sys
 import warnings
 
-import transformers
-
-from iso639 import Lang
-
 from open_dubbing import logger
 from open_dubbing.command_line import CommandLine
-from open_dubbing.dubbing import Dubber
 from open_dubbing.exit_code import ExitCode
 from open_dubbing.ffmpeg import FFmpeg
-from open_dubbing.speech_to_text_faster_whisper import SpeechToTextFasterWhisper
-from open_dubbing.speech_to_text_whisper_transformers import (
-    SpeechToTextWhisperTransformers,
-)
-from open_dubbing.text_to_speech_api import TextToSpeechAPI
-from open_dubbing.text_to_speech_cli import TextToSpeechCLI
-from open_dubbing.text_to_speech_edge import TextToSpeechEdge
-from open_dubbing.text_to_speech_mms import TextToSpeechMMS
-from open_dubbing.translation_apertium import TranslationApertium
-from open_dubbing.translation_nllb import TranslationNLLB
+from open_dubbing.utterance import Utterance
+
+# Modules that depend on transformers or huggingface_hub are imported inside
+# the functions that use them, since the Hugging Face cache settings are read
+# from the environment at import time (see _configure_hf_cache). Other slow
+# to import modules are also imported lazily to keep the startup fast
+
+
+def _configure_hf_cache(hf_cache: str):
+    if hf_cache:
+        os.environ["HF_HOME"] = os.path.abspath(os.path.expanduser(hf_cache))
+
+    # Only used when the hf_xet download backend is installed
+    os.environ.setdefault("HF_XET_HIGH_PERFORMANCE", "1")
+    os.environ.setdefault("HF_XET_NUM_CONCURRENT_RANGE_GETS", "64")
+    os.environ.setdefault("HF_XET_CHUNK_CACHE_SIZE_BYTES", "0")
+
+
+def _configure_threads(cpu_threads: int):
+    if sys.platform == "darwin":
+        os.environ["TOKENIZERS_PARALLELISM"] = "false"
+    else:
+        os.environ.setdefault("TOKENIZERS_PARALLELISM", "true")
+
+    # Read by the OpenMP and MKL runtimes when torch is first imported, they
+    # only take effect if set before any model module is loaded
+    if cpu_threads > 0:
+        os.environ.setdefault("OMP_NUM_THREADS", str(cpu_threads))
+        os.environ.setdefault("MKL_NUM_THREADS", str(cpu_threads))
+
+    import torch
+
+    if cpu_threads > 0:
+        torch.set_num_threads(cpu_threads)
+        torch.set_num_interop_threads(1)
 
 
 def _init_logging(log_level):
+    import transformers
+
     logging.basicConfig(level=logging.ERROR)  # Suppress third-party loggers
 
     # Create your application logger
@@ -64,7 +87,7 @@ def _init_logging(log_level):
 
 def log_error_and_exit(msg: str, code: ExitCode):
     logger().error(msg)
-    exit(code)
+    sys.exit(int(code))
 
 
 def check_languages(
@@ -123,95 +146,199 @@ def get_token(provided_token: str) -> str:
     return token
 
 
+# When updating a dubbing the source language is already known, reading it
+# avoids running the speech to text model to detect it again
+def _get_previous_source_language(target_language: str, output_directory: str) -> str:
+    try:
+        utterance = Utterance(target_language, output_directory)
+        _, _, metadata = utterance.load_utterances()
+        return metadata.get("source_language", "")
+    except Exception as e:
+        logger().debug(f"_get_previous_source_language. Error: '{e}'")
+        return ""
+
+
+@functools.lru_cache(maxsize=None)
+def _get_language_name(language_iso_639_3: str) -> str:
+    from iso639 import Lang
+
+    return Lang(language_iso_639_3).name
+
+
 def _get_language_names(languages_iso_639_3):
-    names = []
-    for language in languages_iso_639_3:
-        o = Lang(language)
-        names.append(o.name)
-    return sorted(names)
+    return sorted(_get_language_name(language) for language in languages_iso_639_3)
 
 
 def list_supported_languages(_tts, translation, device):  # TODO: Not used
+    from open_dubbing.speech_to_text_faster_whisper import SpeechToTextFasterWhisper
+
     s = SpeechToTextFasterWhisper(device=device)
     s.load_model()
     spt = s.get_languages()
     trans = translation.get_languages()
     tts = _tts.get_languages()
 
-    source = _get_language_names(set(spt).intersection(set(trans)))
+    source = _get_language_names(set(spt) & set(trans))
     print(f"Supported source languages: {source}")
 
-    target = _get_language_names(set(tts).intersection(set(trans)))
+    target = _get_language_names(set(tts) & set(trans))
     print(f"Supported target languages: {target}")
 
 
+# Factories are looked up by the name given in the command line. Each one
+# imports its module on first use, so only the selected backend gets loaded
+def _make_tts_mms(*, device: str, **kwargs):
+    from open_dubbing.text_to_speech_mms import TextToSpeechMMS
+
+    return TextToSpeechMMS(device)
+
+
+def _make_tts_edge(*, device: str, **kwargs):
+    from open_dubbing.text_to_speech_edge import TextToSpeechEdge
+
+    return TextToSpeechEdge(device)
+
+
+def _make_tts_coqui(*, device: str, **kwargs):
+    try:
+        from open_dubbing.coqui import Coqui
+        from open_dubbing.text_to_speech_coqui import TextToSpeechCoqui
+    except Exception:
+        msg = "Make sure that Coqui-tts is installed by running 'pip install open-dubbing[coqui]'"
+        log_error_and_exit(msg, ExitCode.NO_COQUI_TTS)
+
+    tts = TextToSpeechCoqui(device)
+    if not Coqui.is_espeak_ng_installed():
+        msg = "To use Coqui-tts you have to have espeak or espeak-ng installed"
+        log_error_and_exit(msg, ExitCode.NO_COQUI_ESPEAK)
+    return tts
+
+
+def _make_tts_cli(*, device: str, tts_cli_cfg_file: str, **kwargs):
+    if len(tts_cli_cfg_file) == 0:
+        msg = "When using the tts CLI you need to provide a configuration file which describes the commands and voices to use."
+        log_error_and_exit(msg, ExitCode.NO_CLI_CFG_FILE)
+
+    from open_dubbing.text_to_speech_cli import TextToSpeechCLI
+
+    return TextToSpeechCLI(device, tts_cli_cfg_file)
+
+
+def _make_tts_api(*, device: str, tts_api_server: str, **kwargs):
+    if len(tts_api_server) == 0:
+        msg = "When using TTS's API, you need to specify with --tts_api_server the URL of the server"
+        log_error_and_exit(msg, ExitCode.NO_TTS_API_SERVER)
+
+    from open_dubbing.text_to_speech_api import TextToSpeechAPI
+
+    return TextToSpeechAPI(device, tts_api_server)
+
+
+def _make_tts_openai(*, device: str, openai_api_key: str, **kwargs):
+    try:
+        from open_dubbing.text_to_speech_openai import TextToSpeechOpenAI
+    except Exception:
+        msg = "Make sure that OpenAI library is installed by running 'pip install open-dubbing[openai]'"
+        log_error_and_exit(msg, ExitCode.NO_OPENAI_TTS)
+
+    key = _get_openai_key(key=openai_api_key)
+    return TextToSpeechOpenAI(device=device, api_key=key)
+
+
+_TTS_FACTORIES = {
+    "mms": _make_tts_mms,
+    "edge": _make_tts_edge,
+    "coqui": _make_tts_coqui,
+    "cli": _make_tts_cli,
+    "api": _make_tts_api,
+    "openai": _make_tts_openai,
+}
+
+
 def _get_selected_tts(
     selected_tts: str,
     tts_cli_cfg_file: str,
     tts_api_server: str,
     device: str,
     openai_api_key: str,
+    tts_concurrency: int = 1,
 ):
-    if selected_tts == "mms":
-        tts = TextToSpeechMMS(device)
-    elif selected_tts == "edge":
-        tts = TextToSpeechEdge(device)
-    elif selected_tts == "coqui":
-        try:
-            from open_dubbing.coqui import Coqui
-            from open_dubbing.text_to_speech_coqui import TextToSpeechCoqui
-        except Exception:
-            msg = "Make sure that Coqui-tts is installed by running 'pip install open-dubbing[coqui]'"
-            log_error_and_exit(msg, ExitCode.NO_COQUI_TTS)
-
-        tts = TextToSpeechCoqui(device)
-        if not Coqui.is_espeak_ng_installed():
-            msg = "To use Coqui-tts you have to have espeak or espeak-ng installed"
-            log_error_and_exit(msg, ExitCode.NO_COQUI_ESPEAK)
-    elif selected_tts == "cli":
-        if len(tts_cli_cfg_file) == 0:
-            msg = "When using the tts CLI you need to provide a configuration file which describes the commands and voices to use."
-            log_error_and_exit(msg, ExitCode.NO_CLI_CFG_FILE)
-
-        tts = TextToSpeechCLI(device, tts_cli_cfg_file)
-    elif selected_tts == "api":
-        tts = TextToSpeechAPI(device, tts_api_server)
-        if len(tts_api_server) == 0:
-            msg = "When using TTS's API, you need to specify with --tts_api_server the URL of the server"
-            log_error_and_exit(msg, ExitCode.NO_TTS_API_SERVER)
-    elif selected_tts == "openai":
-        try:
-            from open_dubbing.text_to_speech_openai import TextToSpeechOpenAI
-        except Exception:
-            msg = "Make sure that OpenAI library is installed by running 'pip install open-dubbing[openai]'"
-            log_error_and_exit(msg, ExitCode.NO_OPENAI_TTS)
-
-        key = _get_openai_key(key=openai_api_key)
-        tts = TextToSpeechOpenAI(device=device, api_key=key)
-    else:
+    factory = _TTS_FACTORIES.get(selected_tts)
+    if not factory:
         raise ValueError(f"Invalid tts value {selected_tts}")
 
+    tts = factory(
+        device=device,
+        tts_cli_cfg_file=tts_cli_cfg_file,
+        tts_api_server=tts_api_server,
+        openai_api_key=openai_api_key,
+    )
+    tts.set_concurrency(tts_concurrency)
     return tts
 
 
+def _make_translator_nllb(
+    *,
+    device: str,
+    nllb_model: str,
+    fast_load: bool = False,
+    fast_cache_dir: str = "",
+    **kwargs,
+):
+    from open_dubbing.translation_nllb import TranslationNLLB
+
+    translation = TranslationNLLB(
+        device, fast_load=fast_load, fast_cache_dir=fast_cache_dir
+    )
+    translation.load_model(nllb_model)
+    return translation
+
+
+def _make_translator_apertium(*, device: str, apertium_server: str, **kwargs):
+    if len(apertium_server) == 0:
+        msg = "When using Apertium's API, you need to specify with --apertium_server the URL of the server"
+        log_error_and_exit(msg, ExitCode.NO_APERTIUM_SERVER)
+
+    from open_dubbing.translation_apertium import TranslationApertium
+
+    translation = TranslationApertium(device)
+    translation.set_server(apertium_server)
+    return translation
+
+
+_TRANSLATOR_FACTORIES = {
+    "nllb": _make_translator_nllb,
+    "apertium": _make_translator_apertium,
+}
+
+
 def _get_selected_translator(
-    translator: str, nllb_model: str, apertium_server: str, device: str
+    translator: str,
+    nllb_model: str,
+    apertium_server: str,
+    device: str,
+    fast_load: bool = False,
+    fast_cache_dir: str = "",
 ):
-    if translator == "nllb":
-        translation = TranslationNLLB(device)
-        translation.load_model(nllb_model)
-    elif translator == "apertium":
-        server = apertium_server
-        if len(server) == 0:
-            msg = "When using Apertium's API, you need to specify with --apertium_server the URL of the server"
-            log_error_and_exit(msg, ExitCode.NO_APERTIUM_SERVER)
-
-        translation = TranslationApertium(device)
-        translation.set_server(server)
-    else:
+    factory = _TRANSLATOR_FACTORIES.get(translator)
+    if not factory:
         raise ValueError(f"Invalid translator value {translator}")
 
-    return translation
+    return factory(
+        device=device,
+        nllb_model=nllb_model,
+        apertium_server=apertium_server,
+        fast_load=fast_load,
+        fast_cache_dir=fast_cache_dir,
+    )
+
+
+def _check_fast_load():
+    try:
+        import accelerate  # noqa: F401
+    except Exception:
+        msg = "Make sure that accelerate is installed by running 'pip install open-dubbing[fast_load]'"
+        log_error_and_exit(msg, ExitCode.NO_ACCELERATE)
 
 
 def _get_openai_key(*, key: str):
@@ -230,6 +357,8 @@ def _get_openai_key(*, key: str):
 def main():
 
     args = CommandLine.read_parameters()
+    _configure_hf_cache(args.hf_cache)
+    _configure_threads(args.cpu_threads)
     _init_logging(args.log_level)
 
     check_is_a_video(args.input_file)
@@ -240,49 +369,75 @@ def main():
         msg = "You need to have ffmpeg (which includes ffprobe) installed."
         log_error_and_exit(msg, ExitCode.NO_FFMPEG)
 
+    if args.fast_load:
+        _check_fast_load()
+
     tts = _get_selected_tts(
         args.tts,
         args.tts_cli_cfg_file,
         args.tts_api_server,
         args.device,
         args.openai_api_key,
+        args.tts_concurrency,
     )
 
-    if sys.platform == "darwin":
-        os.environ["TOKENIZERS_PARALLELISM"] = "false"
-
     stt_type = args.stt
     stt_text = args.stt
     if stt_type == "faster-whisper" or (
         stt_type == "auto" and sys.platform != "darwin"
     ):
+        from open_dubbing.speech_to_text_faster_whisper import SpeechToTextFasterWhisper
+
         stt = SpeechToTextFasterWhisper(
             model_name=args.whisper_model,
             device=args.device,
             cpu_threads=args.cpu_threads,
             vad=args.vad,
+            batch_size=args.batch_size,
+            compute_type=args.compute_type,
+            pack_utterances=args.pack_utterances,
         )
+        if args.batch_size > 1:
+            stt_text += f" (batched, batch size {args.batch_size})"
         if args.vad:
             stt_text += " (with vad filter)"
     else:
+        from open_dubbing.speech_to_text_whisper_transformers import (
+            SpeechToTextWhisperTransformers,
+        )
+
         stt = SpeechToTextWhisperTransformers(
             model_name=args.whisper_model,
             device=args.device,
             cpu_threads=args.cpu_threads,
+            fast_load=args.fast_load,
         )
         if args.vad:
             logger().warning(
                 "Vad filter is only supported in fasterwhisper Speech to Text library"
             )
+        if args.pack_utterances:
+            logger().warning(
+                "Packing utterances is only supported in fasterwhisper Speech to Text library"
+            )
 
     stt.load_model()
     source_language = args.source_language
+    if not source_language and args.update:
+        source_language = _get_previous_source_language(
+            args.target_language, args.output_directory
+        )
     if not source_language:
         source_language = stt.detect_language(args.input_file)
         logger().info(f"Detected language '{source_language}'")
 
     translation = _get_selected_translator(
-        args.translator, args.nllb_model, args.apertium_server, args.device
+        args.translator,
+        args.nllb_model,
+        args.apertium_server,
+        args.device,
+        args.fast_load,
+        args.fast_cache_dir,
     )
 
     check_languages(
@@ -297,6 +452,8 @@ def main():
     if not os.path.exists(args.output_directory):
         os.makedirs(args.output_directory)
 
+    from open_dubbing.dubbing import Dubber
+
     dubber = Dubber(
         input_file=args.input_file,
         output_directory=args.output_directory,
@@ -308,10 +465,10 @@ def main():
         translation=translation,
         stt=stt,
         device=args.device,
-        cpu_threads=args.cpu_threads,
         clean_intermediate_files=args.clean_intermediate_files,
         original_subtitles=args.original_subtitles,
         dubbed_subtitles=args.dubbed_subtitles,
+        trim_silence=args.trim_silence,
     )
 
     logger().info(
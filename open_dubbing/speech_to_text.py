@@ -17,7 +17,7 @@ import os
 import re
 
 from abc import ABC, abstractmethod
-from typing import Mapping, Sequence
+from typing import Iterator, Mapping, Sequence
 
 from iso639 import Lang
 from pydub import AudioSegment
@@ -87,41 +87,66 @@ class SpeechToText(ABC):
         no_dubbing_phrases: Sequence[str],
     ) -> Sequence[Mapping[str, float | str]]:
 
+        return list(
+            self.iter_transcribed_audio_chunks(
+                utterance_metadata=utterance_metadata,
+                source_language=source_language,
+                no_dubbing_phrases=no_dubbing_phrases,
+            )
+        )
+
+    # Yields each utterance as soon as it is transcribed, allowing the caller to
+    # start processing it while the next one is being transcribed
+    def iter_transcribed_audio_chunks(
+        self,
+        *,
+        utterance_metadata: Sequence[Mapping[str, float | str]],
+        source_language: str,
+        no_dubbing_phrases: Sequence[str],
+    ) -> Iterator[Mapping[str, float | str]]:
+
         logger().debug(f"transcribe_audio_chunks: {source_language}")
         iso_639_1 = self._get_iso_639_1(source_language)
 
-        updated_utterance_metadata = []
         for item in utterance_metadata:
-            new_item = item.copy()
-            path = ""
-            try:
-                path = item["path"]
-                duration = item["end"] - item["start"]
-                if self._is_short_audio(duration=duration):
-                    transcribed_text = ""
-                    logger().debug(
-                        f"speech_to_text._is_short_audio. Audio is less than {self.MIN_SECS} second, skipping transcription of '{path}'."
-                    )
-                else:
-                    transcribed_text = self._transcribe(
-                        vocals_filepath=path,
-                        source_language_iso_639_1=iso_639_1,
-                    )
-                    transcribed_text = self._make_sure_single_space(transcribed_text)
-            except Exception as e:
-                logger().error(
-                    f"speech_to_text.transcribe_audio_chunks. file '{path}', error: '{e}'"
+            transcribed_text = self._transcribe_utterance(item, iso_639_1)
+            yield self._get_transcribed_item(item, transcribed_text)
+
+    def _get_transcribed_item(
+        self, item: Mapping[str, float | str], transcribed_text: str
+    ) -> Mapping[str, float | str]:
+        new_item = item.copy()
+        dubbing = len(transcribed_text) > 0
+        logger().debug(
+            f"transcribe_audio_chunks. text: '{transcribed_text}' - dubbing: {dubbing}"
+        )
+        new_item["text"] = transcribed_text
+        new_item["for_dubbing"] = dubbing
+        return new_item
+
+    def _transcribe_utterance(
+        self, item: Mapping[str, float | str], source_language_iso_639_1: str
+    ) -> str:
+        path = ""
+        try:
+            path = item["path"]
+            duration = item["end"] - item["start"]
+            if self._is_short_audio(duration=duration):
+                logger().debug(
+                    f"speech_to_text._is_short_audio. Audio is less than {self.MIN_SECS} second, skipping transcription of '{path}'."
                 )
-                transcribed_text = ""
+                return ""
 
-            dubbing = len(transcribed_text) > 0
-            logger().debug(
-                f"transcribe_audio_chunks. text: '{transcribed_text}' - dubbing: {dubbing}"
+            transcribed_text = self._transcribe(
+                vocals_filepath=path,
+                source_language_iso_639_1=source_language_iso_639_1,
             )
-            new_item["text"] = transcribed_text
-            new_item["for_dubbing"] = dubbing
-            updated_utterance_metadata.append(new_item)
-        return updated_utterance_metadata
+            return self._make_sure_single_space(transcribed_text)
+        except Exception as e:
+            logger().error(
+                f"speech_to_text.transcribe_audio_chunks. file '{path}', error: '{e}'"
+            )
+            return ""
 
     #  Returns a list of unique speakers with the largest audio sample for the speaker
     def _get_unique_speakers_largest_audio(self, utterance_metadata):
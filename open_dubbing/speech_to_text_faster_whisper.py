@@ -13,10 +13,15 @@
 # limitations under the License.
 
 import array
+import bisect
+import functools
+
+from typing import Iterator, Mapping, Sequence
 
 import numpy as np
 
-from faster_whisper import WhisperModel
+from faster_whisper import BatchedInferencePipeline, WhisperModel, decode_audio
+from pydub import AudioSegment
 
 from open_dubbing import logger
 from open_dubbing.speech_to_text import SpeechToText
@@ -24,24 +29,54 @@ from open_dubbing.speech_to_text import SpeechToText
 
 class SpeechToTextFasterWhisper(SpeechToText):
 
-    def __init__(self, *, model_name="medium", device="cpu", cpu_threads=0, vad=False):
+    def __init__(
+        self,
+        *,
+        model_name="medium",
+        device="cpu",
+        cpu_threads=0,
+        vad=False,
+        batch_size=1,
+        compute_type=None,
+        pack_utterances=False,
+    ):
         super().__init__(device=device, model_name=model_name, cpu_threads=cpu_threads)
         self.vad = vad
+        self.batch_size = batch_size
+        self.compute_type = compute_type
+        self.pack_utterances = pack_utterances
+        self.PACKED_GAP_SECS = 1.0
+        self._batched_model = None
+
+    # Int8 weights halve the memory read per decoding step, which is what bounds
+    # the decoder speed. On CUDA the activations are kept in float16.
+    def _get_compute_type(self):
+        if self.compute_type is not None:
+            return self.compute_type
+
+        return "int8_float16" if self.device == "cuda" else "int8"
 
     def load_model(self):
         self._model = WhisperModel(
             model_size_or_path=self.model_name,
             device=self.device,
             cpu_threads=self.cpu_threads,
-            compute_type="float16" if self.device == "cuda" else "int8",
+            compute_type=self._get_compute_type(),
         )
+        # The batched pipeline splits the audio with VAD and runs the resulting
+        # chunks through the encoder and decoder as a single batch
+        if self.batch_size > 1:
+            self._batched_model = BatchedInferencePipeline(model=self._model)
 
     def get_languages(self):
-        iso_639_3 = []
-        for language in self.model.supported_languages:
-            pt3 = self._get_iso_639_3(language)
-            iso_639_3.append(pt3)
-        return iso_639_3
+        return self._languages
+
+    # The supported languages do not change once the model is loaded
+    @functools.cached_property
+    def _languages(self):
+        return [
+            self._get_iso_639_3(language) for language in self.model.supported_languages
+        ]
 
     def _transcribe(
         self,
@@ -49,11 +84,134 @@ class SpeechToTextFasterWhisper(SpeechToText):
         vocals_filepath: str,
         source_language_iso_639_1: str,
     ) -> str:
-        segments, _ = self.model.transcribe(
-            vocals_filepath, source_language_iso_639_1, vad_filter=self.vad
-        )
+        if self._batched_model:
+            segments, _ = self._transcribe_batched(
+                vocals_filepath, source_language_iso_639_1
+            )
+        else:
+            segments, _ = self.model.transcribe(
+                vocals_filepath, source_language_iso_639_1, vad_filter=self.vad
+            )
         return " ".join(segment.text for segment in segments)
 
+    def _transcribe_batched(self, audio, source_language_iso_639_1: str, **kwargs):
+        # Without the VAD filter, the batched pipeline needs to be told which
+        # windows of the audio to transcribe
+        if not self.vad:
+            if isinstance(audio, str):
+                audio = decode_audio(audio)
+
+            feature_extractor = self.model.feature_extractor
+            window = feature_extractor.chunk_length * feature_extractor.sampling_rate
+            kwargs["clip_timestamps"] = [
+                {"start": start, "end": min(start + window, len(audio))}
+                for start in range(0, len(audio), window)
+            ]
+
+        return self._batched_model.transcribe(
+            audio,
+            source_language_iso_639_1,
+            vad_filter=self.vad,
+            batch_size=self.batch_size,
+            **kwargs,
+        )
+
+    # Whisper processes the audio in windows of 30 secs, transcribing several
+    # short utterances in a single window avoids encoding mostly padding
+    def iter_transcribed_audio_chunks(
+        self,
+        *,
+        utterance_metadata: Sequence[Mapping[str, float | str]],
+        source_language: str,
+        no_dubbing_phrases: Sequence[str],
+    ) -> Iterator[Mapping[str, float | str]]:
+        if not self.pack_utterances:
+            yield from super().iter_transcribed_audio_chunks(
+                utterance_metadata=utterance_metadata,
+                source_language=source_language,
+                no_dubbing_phrases=no_dubbing_phrases,
+            )
+            return
+
+        from open_dubbing.audio_processing import pack_utterances
+
+        logger().debug(f"transcribe_audio_chunks: {source_language} (packed)")
+        iso_639_1 = self._get_iso_639_1(source_language)
+        groups = pack_utterances(
+            utterance_metadata=utterance_metadata,
+            gap=self.PACKED_GAP_SECS,
+            min_duration=self.MIN_SECS,
+        )
+        for group in groups:
+            items = [utterance_metadata[idx] for idx in group]
+            if len(items) == 1:
+                texts = [self._transcribe_utterance(items[0], iso_639_1)]
+            else:
+                texts = self._transcribe_packed_utterances(items, iso_639_1)
+
+            for item, transcribed_text in zip(items, texts):
+                yield self._get_transcribed_item(item, transcribed_text)
+
+    def _transcribe_packed_utterances(
+        self, items: Sequence[Mapping[str, float | str]], source_language_iso_639_1: str
+    ) -> Sequence[str]:
+        paths = [item.get("path", "") for item in items]
+        try:
+            texts = self._transcribe_packed(
+                vocals_filepaths=paths,
+                source_language_iso_639_1=source_language_iso_639_1,
+            )
+            return [self._make_sure_single_space(text) for text in texts]
+        except Exception as e:
+            logger().error(
+                f"speech_to_text.transcribe_audio_chunks. files '{paths}', error: '{e}'"
+            )
+            return [""] * len(items)
+
+    # Transcribes the files as a single audio, separated by silences, and
+    # assigns each word to the file in which it is placed
+    def _transcribe_packed(
+        self,
+        *,
+        vocals_filepaths: Sequence[str],
+        source_language_iso_639_1: str,
+    ) -> Sequence[str]:
+        sample_rate = 16000
+        silence = np.zeros(int(self.PACKED_GAP_SECS * sample_rate), dtype=np.float32)
+        chunks = []
+        starts = []
+        offset = 0
+        for vocals_filepath in vocals_filepaths:
+            audio = AudioSegment.from_file(vocals_filepath)
+            audio = audio.set_channels(1).set_frame_rate(sample_rate)
+            audio = audio.set_sample_width(2)
+            samples = np.frombuffer(audio.raw_data, dtype=np.int16)
+            starts.append(offset / sample_rate)
+            chunks += [samples.astype(np.float32) / 32768.0, silence]
+            offset += len(samples) + len(silence)
+
+        audio_input = np.concatenate(chunks)
+        if self._batched_model:
+            segments, _ = self._transcribe_batched(
+                audio_input, source_language_iso_639_1, word_timestamps=True
+            )
+        else:
+            segments, _ = self.model.transcribe(
+                audio_input,
+                source_language_iso_639_1,
+                vad_filter=self.vad,
+                word_timestamps=True,
+            )
+
+        texts = [[] for _ in vocals_filepaths]
+        for segment in segments:
+            for word in segment.words:
+                middle = (word.start + word.end) / 2
+                idx = max(bisect.bisect_right(starts, middle) - 1, 0)
+                texts[idx].append(word.word)
+
+        return ["".join(words) for words in texts]
+
     def _get_audio_language(self, audio: array.array) -> str:
         audio_input = np.array(audio).astype(np.float32) / 32768.0
         _, info = self.model.transcribe(audio_input)
@@ -26,14 +26,36 @@ from open_dubbing.speech_to_text import SpeechToText
 
 class SpeechToTextWhisperTransformers(SpeechToText):
 
-    def __init__(self, *, model_name="medium", device="cpu", cpu_threads=0):
+    def __init__(
+        self, *, model_name="medium", device="cpu", cpu_threads=0, fast_load=False
+    ):
         super().__init__(device=device, model_name=model_name, cpu_threads=cpu_threads)
         self._processor = None
+        self.fast_load = fast_load
 
     def load_model(self):
         full_model_name = f"openai/whisper-{self.model_name}"
         self._processor = WhisperProcessor.from_pretrained(full_model_name)
-        self._model = WhisperForConditionalGeneration.from_pretrained(full_model_name)
+        kwargs = {}
+        if self.device == "cuda":
+            # Older GPUs (e.g. T4, V100) have no native bfloat16 support
+            kwargs["torch_dtype"] = (
+                torch.bfloat16 if torch.cuda.is_bf16_supported() else torch.float16
+            )
+
+        if self.fast_load:
+            # Materializes the weights directly in the target device without
+            # keeping an intermediate copy in CPU memory (requires accelerate)
+            self._model = WhisperForConditionalGeneration.from_pretrained(
+                full_model_name,
+                low_cpu_mem_usage=True,
+                device_map=self.device,
+                **kwargs,
+            )
+        else:
+            self._model = WhisperForConditionalGeneration.from_pretrained(
+                full_model_name, **kwargs
+            ).to(self.device)
 
     def _transcribe(
         self,
@@ -53,7 +75,7 @@ class SpeechToTextWhisperTransformers(SpeechToText):
         # Preprocess the audio input
         input_features = self._processor(
             audio_input, sampling_rate=16000, return_tensors="pt"
-        ).input_features
+        ).input_features.to(self._model.device, dtype=self._model.dtype)
 
         with torch.no_grad():
             generated_ids = self._model.generate(
@@ -73,7 +95,7 @@ class SpeechToTextWhisperTransformers(SpeechToText):
         # Preprocess the audio input
         input_features = self._processor(
             audio_input, sampling_rate=16000, return_tensors="pt"
-        ).input_features
+        ).input_features.to(self._model.device, dtype=self._model.dtype)
 
         with torch.no_grad():
             generated_ids = self._model.generate(input_features)
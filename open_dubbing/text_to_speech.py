@@ -16,6 +16,7 @@ import math
 import os
 
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from typing import Final, List, Mapping, NamedTuple, Sequence
 
 from pydub import AudioSegment
@@ -37,6 +38,8 @@ class TextToSpeech(ABC):
         self._SSML_MALE: Final[str] = "Male"
         self._SSML_FEMALE: Final[str] = "Female"
         self._DEFAULT_SPEED: Final[float] = 1.0
+        self.concurrency = 1
+        self._audio_durations = {}
 
     @abstractmethod
     def get_available_voices(self, language_code: str) -> List[Voice]:
@@ -229,6 +232,22 @@ class TextToSpeech(ABC):
     def _does_voice_supports_speeds(self):
         return False
 
+    # Only TTS that are bound by network I/O should support concurrency. The ones
+    # running a local model will compete for the same CPU or GPU.
+    def _supports_concurrency(self):
+        return False
+
+    def set_concurrency(self, concurrency: int):
+        self.concurrency = concurrency
+
+    # All the utterances share the same source audio, decode it only once
+    def _get_audio_duration(self, audio_file: str) -> float:
+        if audio_file not in self._audio_durations:
+            audio = AudioSegment.from_mp3(audio_file)
+            self._audio_durations[audio_file] = audio.duration_seconds
+
+        return self._audio_durations[audio_file]
+
     def get_start_time_of_next_speech_utterance(
         self,
         *,
@@ -252,8 +271,7 @@ class TextToSpeech(ABC):
 
         if not result:
             try:
-                background_audio = AudioSegment.from_mp3(audio_file)
-                total_duration = background_audio.duration_seconds
+                total_duration = self._get_audio_duration(audio_file)
                 logger().debug(
                     f"get_start_time_of_next_speech_utterance. File duration: {total_duration}"
                 )
@@ -284,96 +302,118 @@ class TextToSpeech(ABC):
         if modified_metadata is not None:
             modified_ids = {utterance["id"] for utterance in modified_metadata}
 
-        updated_utterance_metadata = []
-        for utterance in utterance_metadata:
+        def _dub(utterance):
             if modified_metadata is not None and utterance["id"] not in modified_ids:
-                utterance_copy = utterance.copy()
-                updated_utterance_metadata.append(utterance_copy)
-                continue
+                return utterance.copy()
+
+            return self._dub_utterance(
+                utterance=utterance,
+                utterance_metadata=utterance_metadata,
+                output_directory=output_directory,
+                target_language=target_language,
+                audio_file=audio_file,
+            )
 
-            utterance_copy = utterance.copy()
-            if not utterance_copy["for_dubbing"]:
-                try:
-                    dubbed_path = utterance_copy["path"]
-                except KeyError:
-                    dubbed_path = f"chunk_{utterance['start']}_{utterance['end']}.mp3"
-            else:
-                assigned_voice = utterance_copy["assigned_voice"]
-                text = utterance_copy["translated_text"]
-                try:
-                    path = utterance_copy["path"]
-                    base_filename = os.path.splitext(os.path.basename(path))[0]
-                    output_filename = os.path.join(
-                        output_directory, f"dubbed_{base_filename}.mp3"
-                    )
-                except KeyError:
-                    output_filename = os.path.join(
-                        output_directory,
-                        f"dubbed_chunk_{utterance['start']}_{utterance['end']}.mp3",
-                    )
+        workers = self.concurrency if self._supports_concurrency() else 1
+        if workers <= 1:
+            return [_dub(utterance) for utterance in utterance_metadata]
+
+        logger().debug(f"text_to_speech.dub_utterances. Using {workers} workers")
+        # map returns the results in submission order
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(_dub, utterance_metadata))
 
-                speed = utterance_copy["speed"]
-                dubbed_path = self._convert_text_to_speech_without_end_silence(
-                    assigned_voice=assigned_voice,
-                    target_language=target_language,
-                    output_filename=output_filename,
-                    text=text,
-                    speed=speed,
+    def _dub_utterance(
+        self,
+        *,
+        utterance: Mapping[str, str | float],
+        utterance_metadata: Sequence[Mapping[str, str | float]],
+        output_directory: str,
+        target_language: str,
+        audio_file: str,
+    ) -> Mapping[str, str | float]:
+        utterance_copy = utterance.copy()
+        if not utterance_copy["for_dubbing"]:
+            try:
+                dubbed_path = utterance_copy["path"]
+            except KeyError:
+                dubbed_path = f"chunk_{utterance['start']}_{utterance['end']}.mp3"
+        else:
+            assigned_voice = utterance_copy["assigned_voice"]
+            text = utterance_copy["translated_text"]
+            try:
+                path = utterance_copy["path"]
+                base_filename = os.path.splitext(os.path.basename(path))[0]
+                output_filename = os.path.join(
+                    output_directory, f"dubbed_{base_filename}.mp3"
                 )
-                assigned_voice = utterance_copy.get("assigned_voice", None)
-                assigned_voice = assigned_voice if assigned_voice else ""
-                support_speeds = self._does_voice_supports_speeds()
-
-                start = utterance["start"]
-                end = utterance["end"]
-                speed = self._calculate_target_utterance_speed(
-                    start=start,
-                    end=end,
-                    dubbed_file=dubbed_path,
-                    utterance_metadata=utterance_metadata,
-                    audio_file=audio_file,
+            except KeyError:
+                output_filename = os.path.join(
+                    output_directory,
+                    f"dubbed_chunk_{utterance['start']}_{utterance['end']}.mp3",
                 )
 
-                logger().debug(f"support_speeds: {support_speeds}, speed: {speed}")
+            speed = utterance_copy["speed"]
+            dubbed_path = self._convert_text_to_speech_without_end_silence(
+                assigned_voice=assigned_voice,
+                target_language=target_language,
+                output_filename=output_filename,
+                text=text,
+                speed=speed,
+            )
+            assigned_voice = utterance_copy.get("assigned_voice", None)
+            assigned_voice = assigned_voice if assigned_voice else ""
+            support_speeds = self._does_voice_supports_speeds()
+
+            start = utterance["start"]
+            end = utterance["end"]
+            speed = self._calculate_target_utterance_speed(
+                start=start,
+                end=end,
+                dubbed_file=dubbed_path,
+                utterance_metadata=utterance_metadata,
+                audio_file=audio_file,
+            )
 
-                if speed > 1.0:
-                    translated_text = utterance_copy["translated_text"]
-                    logger().debug(
-                        f"text_to_speech.dub_utterances. Need to increase speed for '{translated_text}'"
-                    )
+            logger().debug(f"support_speeds: {support_speeds}, speed: {speed}")
 
-                    MAX_SPEED = 1.3
-                    if speed > MAX_SPEED:
-                        logger().debug(
-                            f"text_to_speech.dub_utterances: Reduced speed from {speed} to {MAX_SPEED}"
-                        )
-                        speed = MAX_SPEED
+            if speed > 1.0:
+                translated_text = utterance_copy["translated_text"]
+                logger().debug(
+                    f"text_to_speech.dub_utterances. Need to increase speed for '{translated_text}'"
+                )
 
-                    translated_text = utterance_copy["translated_text"]
+                MAX_SPEED = 1.3
+                if speed > MAX_SPEED:
                     logger().debug(
-                        f"text_to_speech.dub_utterances: Adjusting speed to {speed} for '{translated_text}'"
+                        f"text_to_speech.dub_utterances: Reduced speed from {speed} to {MAX_SPEED}"
                     )
+                    speed = MAX_SPEED
 
-                    utterance_copy["speed"] = speed
-                    if support_speeds:
-                        dubbed_path = self._convert_text_to_speech_without_end_silence(
-                            assigned_voice=assigned_voice,
-                            target_language=target_language,
-                            output_filename=output_filename,
-                            text=text,
-                            speed=speed,
-                        )
-                    else:
-                        FFmpeg().adjust_audio_speed(
-                            filename=dubbed_path,
-                            speed=speed,
-                        )
-                        logger().debug(
-                            f"text_to_speech.adjust_audio_speed: dubbed_audio: {dubbed_path}, speed: {speed}"
-                        )
+                translated_text = utterance_copy["translated_text"]
+                logger().debug(
+                    f"text_to_speech.dub_utterances: Adjusting speed to {speed} for '{translated_text}'"
+                )
+
+                utterance_copy["speed"] = speed
+                if support_speeds:
+                    dubbed_path = self._convert_text_to_speech_without_end_silence(
+                        assigned_voice=assigned_voice,
+                        target_language=target_language,
+                        output_filename=output_filename,
+                        text=text,
+                        speed=speed,
+                    )
                 else:
-                    utterance_copy["speed"] = self._DEFAULT_SPEED
+                    FFmpeg().adjust_audio_speed(
+                        filename=dubbed_path,
+                        speed=speed,
+                    )
+                    logger().debug(
+                        f"text_to_speech.adjust_audio_speed: dubbed_audio: {dubbed_path}, speed: {speed}"
+                    )
+            else:
+                utterance_copy["speed"] = self._DEFAULT_SPEED
 
-            utterance_copy["dubbed_path"] = dubbed_path
-            updated_utterance_metadata.append(utterance_copy)
-        return updated_utterance_metadata
+        utterance_copy["dubbed_path"] = dubbed_path
+        return utterance_copy
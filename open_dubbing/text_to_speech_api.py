@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import functools
 import tempfile
 import time
 
@@ -32,10 +33,22 @@ class TextToSpeechAPI(TextToSpeech):
         self.device = device
         self.voices = None
 
+    # Keeps the connections to the server open between requests, with a pool
+    # large enough for the concurrent synthesis
+    @functools.cached_property
+    def _session(self):
+        session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=1, pool_maxsize=max(self.concurrency, 1)
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
     def _get_voices(self):
         if not self.voices:
             url = urljoin(self.server, "/voices")
-            response = requests.get(url)
+            response = self._session.get(url)
             self.voices = response.json()
 
         return self.voices
@@ -64,6 +77,9 @@ class TextToSpeechAPI(TextToSpeech):
     def _does_voice_supports_speeds(self):
         return False
 
+    def _supports_concurrency(self):
+        return True
+
     def _convert_text_to_speech(
         self,
         *,
@@ -80,7 +96,7 @@ class TextToSpeechAPI(TextToSpeech):
         max_retries = 3
         for attempt in range(1, max_retries + 1):
             try:
-                response = requests.get(url)
+                response = self._session.get(url)
 
                 temp_filename = None
                 with tempfile.NamedTemporaryFile(delete=False) as temporary_file:
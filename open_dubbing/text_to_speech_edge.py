@@ -75,6 +75,9 @@ class TextToSpeechEdge(TextToSpeech):
     def _does_voice_supports_speeds(self):
         return True
 
+    def _supports_concurrency(self):
+        return True
+
     async def _save(self, text, speed, assigned_voice, output_filename):
         per = (100 * speed) - 100
         str_per = f"+{per:0.0f}%"
@@ -29,6 +29,23 @@ class TextToSpeechMMS(TextToSpeech):
     def __init__(self, device="cpu"):
         super().__init__()
         self.device = device
+        self._models = {}
+
+    # Loaded once per language and reused for all the utterances
+    def _get_model_and_tokenizer(self, target_language: str):
+        if target_language not in self._models:
+            local_files_only = False
+            model = VitsModel.from_pretrained(
+                f"facebook/mms-tts-{target_language}",
+                local_files_only=local_files_only,
+            ).to(self.device)
+            tokenizer = AutoTokenizer.from_pretrained(
+                f"facebook/mms-tts-{target_language}",
+                local_files_only=local_files_only,
+            )
+            self._models[target_language] = (model, tokenizer)
+
+        return self._models[target_language]
 
     def get_available_voices(self, language_code: str) -> List[Voice]:
         return [Voice(name="voice", gender=self._SSML_MALE)]
@@ -44,15 +61,7 @@ class TextToSpeechMMS(TextToSpeech):
     ) -> str:
 
         logger().debug(f"TextToSpeechMMS._convert_text_to_speech: {text}")
-        local_files_only = False
-
-        # Load pre-trained model and tokenizer
-        model = VitsModel.from_pretrained(
-            f"facebook/mms-tts-{target_language}", local_files_only=local_files_only
-        ).to(self.device)
-        tokenizer = AutoTokenizer.from_pretrained(
-            f"facebook/mms-tts-{target_language}", local_files_only=local_files_only
-        )
+        model, tokenizer = self._get_model_and_tokenizer(target_language)
         inputs = tokenizer(text, return_tensors="pt").to(self.device)
 
         # Generate waveform
@@ -59,6 +59,9 @@ class TextToSpeechOpenAI(TextToSpeech):
     def _does_voice_supports_speeds(self):
         return False
 
+    def _supports_concurrency(self):
+        return True
+
     def _convert_text_to_speech(
         self,
         *,
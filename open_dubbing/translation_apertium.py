@@ -12,10 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import json
 import time
 import urllib
 
+import requests
+
 from open_dubbing import logger
 from open_dubbing.translation import Translation
 
@@ -30,15 +31,16 @@ class TranslationApertium(Translation):
             server = server + "/"
 
         self.server = server
+        # Keeps the connection to the server open between requests
+        self._session = requests.Session()
 
     def _do_api_call(self, url):
         max_retries = 3
         for attempt in range(1, max_retries + 1):
             try:
-                response = urllib.request.urlopen(url)
-                r = response.read().decode("utf-8")
-                data = json.loads(r)
-                return data["responseData"]
+                response = self._session.get(url)
+                response.raise_for_status()
+                return response.json()["responseData"]
             except Exception:
                 if attempt == max_retries:
                     logger().error(
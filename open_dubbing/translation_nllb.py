@@ -12,6 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import functools
+import hashlib
+import os
+import shutil
+
+import transformers
+
 from transformers import AutoModelForSeq2SeqLM, AutoTokenizer, pipeline
 
 from open_dubbing import logger
@@ -20,10 +27,12 @@ from open_dubbing.translation import Translation
 
 class TranslationNLLB(Translation):
 
-    def __init__(self, device="cpu"):
+    def __init__(self, device="cpu", fast_load=False, fast_cache_dir=""):
         super().__init__(device)
         self.translator = None
         self.translator_languages = ""
+        self.fast_load = fast_load
+        self.fast_cache_dir = fast_cache_dir
 
     def load_model(self, name="nllb-200-1.3B"):
         self.model_name = f"facebook/{name}"
@@ -34,10 +43,9 @@ class TranslationNLLB(Translation):
     ) -> str:
         languages = f"{source_language}{target_language}"
         if not self.translator or self.translator_languages != languages:
-            model = self._get_model_nllb()
             self.translator = pipeline(
                 "translation",
-                model=model,
+                model=self.model,
                 tokenizer=self.tokenizer,
                 src_lang=self._get_nllb_language(source_language),
                 tgt_lang=self._get_nllb_language(target_language),
@@ -51,40 +59,85 @@ class TranslationNLLB(Translation):
     def _get_tokenizer_nllb(self):
         return AutoTokenizer.from_pretrained(self.model_name)
 
+    # The model is shared by all the language pairs, changing the pair only
+    # requires a new pipeline
+    @functools.cached_property
+    def model(self):
+        return self._get_model_nllb()
+
     def _get_model_nllb(self):
+        cached_model_path = self._get_fast_cache_path()
+        if cached_model_path and os.path.isdir(cached_model_path):
+            logger().debug(f"Loading translation model from '{cached_model_path}'")
+            return self._load_model(cached_model_path)
+
+        model = self._load_model(self.model_name)
+        if cached_model_path:
+            self._save_fast_cache(model, cached_model_path)
+        return model
+
+    def _get_fast_cache_path(self) -> str:
+        if not self.fast_cache_dir:
+            return ""
+
+        key = f"{self.model_name}-{transformers.__version__}"
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.fast_cache_dir, digest)
+
+    # NLLB checkpoints are distributed as pickled PyTorch files. Keeping a
+    # copy as a single safetensors file allows the next runs to memory map
+    # the weights instead of unpickling them
+    def _save_fast_cache(self, model, cached_model_path: str):
+        temporary_path = f"{cached_model_path}.tmp"
         try:
-            return AutoModelForSeq2SeqLM.from_pretrained(self.model_name).to(
-                self.device
+            model.save_pretrained(
+                temporary_path, safe_serialization=True, max_shard_size="100GB"
+            )
+            os.replace(temporary_path, cached_model_path)
+        except OSError as e:
+            logger().warning(
+                f"Unable to save translation model at '{cached_model_path}': {e}"
             )
+            shutil.rmtree(temporary_path, ignore_errors=True)
+
+    def _load_model(self, model_path: str):
+        try:
+            # Materializes the weights directly in the target device without
+            # keeping an intermediate copy in CPU memory (requires accelerate)
+            if self.fast_load:
+                return AutoModelForSeq2SeqLM.from_pretrained(
+                    model_path, low_cpu_mem_usage=True, device_map=self.device
+                )
+
+            return AutoModelForSeq2SeqLM.from_pretrained(model_path).to(self.device)
         except RuntimeError as e:
             if self.device == "cuda":
                 logger().warning(
-                    f"Loading translation model {self.model_name} in CPU since cannot be load in GPU"
+                    f"Loading translation model {model_path} in CPU since cannot be load in GPU"
                 )
-                return AutoModelForSeq2SeqLM.from_pretrained(self.model_name).to("cpu")
+                return AutoModelForSeq2SeqLM.from_pretrained(model_path).to("cpu")
             else:
                 raise e
 
     def get_language_pairs(self):
-        tokenizer = self._get_tokenizer_nllb()
+        return self._language_pairs
+
+    # All the combinations of the about 200 languages supported, computed once
+    @functools.cached_property
+    def _language_pairs(self):
         # Returns 'cat_Latn'
-        original_list = tokenizer.additional_special_tokens
+        original_list = self.tokenizer.additional_special_tokens
         # Get only the language codes
         supported_languages = [s[:3] for s in original_list]
-        pairs = set()
-        for source in supported_languages:
-            for target in supported_languages:
-                if source == target:
-                    continue
-
-                pair = (source, target)
-                pairs.add(pair)
-
-        return pairs
+        return frozenset(
+            (source, target)
+            for source in supported_languages
+            for target in supported_languages
+            if source != target
+        )
 
     def _get_nllb_language(self, source_language_iso_639_3: str) -> str:
-        tokenizer = self._get_tokenizer_nllb()
-        nllb_languages = tokenizer.additional_special_tokens
+        nllb_languages = self.tokenizer.additional_special_tokens
         for nllb_language in nllb_languages:
             if nllb_language[:3] == source_language_iso_639_3:
                 return nllb_language
@@ -44,6 +44,7 @@ setup(
         "dev": ["flake8==7.*", "black==24.*", "pytest==8.*", "isort==5.13"],
         "coqui": ["coqui-tts >= 0.25.1"],
         "openai": ["openai == 1.59.3"],
+        "fast_load": ["accelerate == 1.0.1"],
     },
     entry_points={
         "console_scripts": [
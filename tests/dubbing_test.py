@@ -15,12 +15,13 @@
 import os
 import tempfile
 
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 
 from open_dubbing import dubbing
 from open_dubbing.dubbing import Dubber
+from open_dubbing.preprocessing import PreprocessingArtifacts
 from open_dubbing.utterance import Utterance
 
 
@@ -134,3 +135,77 @@ class TestDubbing:
             obj.run_cleaning()
             for path in paths + dubbed_paths + [dubbed_audio_path, dubbed_vocals_path]:
                 assert os.path.exists(path), f"File {path} was deleted"
+
+    def test_run_speech_to_text_and_translation(self):
+        stt = MagicMock()
+        stt.iter_transcribed_audio_chunks.return_value = iter(
+            [
+                {"start": 0.0, "end": 1.0, "text": "Hello", "for_dubbing": True},
+                {"start": 1.0, "end": 2.0, "text": "", "for_dubbing": False},
+                {"start": 2.0, "end": 3.0, "text": "World", "for_dubbing": True},
+            ]
+        )
+        stt.predict_gender.return_value = [("s1", "Male")] * 3
+        stt.add_speaker_info.side_effect = lambda utterance_metadata, speaker_info: [
+            {**item, "speaker_id": speaker_id, "gender": gender}
+            for item, (speaker_id, gender) in zip(utterance_metadata, speaker_info)
+        ]
+        translation = MagicMock()
+        translation.translate_text.side_effect = lambda text, **kwargs: text.upper()
+
+        obj = Dubber(
+            input_file="",
+            output_directory=self.temp_dir,
+            source_language="eng",
+            target_language="cat",
+            target_language_region="",
+            hugging_face_token="",
+            tts=None,
+            translation=translation,
+            stt=stt,
+            device="cpu",
+        )
+        obj.utterance_metadata = []
+        obj.preprocessing_output = PreprocessingArtifacts(
+            video_file="video.mp4", audio_file="audio.mp3"
+        )
+
+        obj.run_speech_to_text_and_translation()
+        assert [item["translated_text"] for item in obj.utterance_metadata] == [
+            "HELLO",
+            "WORLD",
+        ]
+        assert obj.utterance_metadata[0]["speaker_id"] == "s1"
+
+    def test_run_speech_to_text_and_translation_error(self):
+        transcribed_items = []
+
+        def _iter_transcribed_audio_chunks(**kwargs):
+            for idx in range(20):
+                transcribed_items.append(idx)
+                yield {"start": idx, "end": idx + 1, "text": "Hello"}
+
+        stt = MagicMock()
+        stt.iter_transcribed_audio_chunks.side_effect = _iter_transcribed_audio_chunks
+        translation = MagicMock()
+        translation.translate_text.side_effect = Exception("Translation error")
+
+        obj = Dubber(
+            input_file="",
+            output_directory=self.temp_dir,
+            source_language="eng",
+            target_language="cat",
+            target_language_region="",
+            hugging_face_token="",
+            tts=None,
+            translation=translation,
+            stt=stt,
+            device="cpu",
+        )
+        obj.utterance_metadata = []
+
+        with pytest.raises(Exception, match="Translation error"):
+            obj.run_speech_to_text_and_translation()
+
+        # The worker stops instead of transcribing all the utterances
+        assert len(transcribed_items) < 20
@@ -18,6 +18,9 @@ import tempfile
 
 from unittest.mock import MagicMock, patch
 
+from pydub import AudioSegment
+from pydub.generators import Sine
+
 from open_dubbing.ffmpeg import FFmpeg
 
 
@@ -81,6 +84,27 @@ class TestFFmpeg:
         expected = self._get_srt()
         assert subtitles == expected
 
+    def test_cut_audio(self):
+        with tempfile.TemporaryDirectory() as output_directory:
+            # Half a second of silence followed by half a second of tone
+            audio_file = os.path.join(output_directory, "source.mp3")
+            source = AudioSegment.silent(duration=500) + Sine(440).to_audio_segment(
+                duration=500, volume=-6
+            )
+            source.export(audio_file, format="mp3")
+            cuts = [
+                (0.0, 0.5, os.path.join(output_directory, "chunk_0.0_0.5.mp3")),
+                (0.5, 1.0, os.path.join(output_directory, "chunk_0.5_1.0.mp3")),
+            ]
+            FFmpeg().cut_audio(source=audio_file, cuts=cuts)
+            silence, tone = [AudioSegment.from_file(target) for _, _, target in cuts]
+
+        # Allow for the padding added by the mp3 encoder
+        tolerance = 60
+        assert abs(len(silence) - 500) <= tolerance
+        assert abs(len(tone) - 500) <= tolerance
+        assert tone.dBFS - silence.dBFS > 20
+
     @patch("subprocess.run")
     def test_is_ffmpeg_installed(self, mock_subprocess):
         # Test when ffmpeg is installed
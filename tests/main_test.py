@@ -13,16 +13,26 @@
 # limitations under the License.
 
 import os
+import sys
+import tempfile
 
 from unittest.mock import patch
 
 import pytest
 
+from open_dubbing.exit_code import ExitCode
 from open_dubbing.main import (
+    _check_fast_load,
+    _configure_hf_cache,
+    _configure_threads,
+    _get_language_names,
     _get_openai_key,
+    _get_previous_source_language,
     _get_selected_translator,
     _get_selected_tts,
 )
+from open_dubbing.preprocessing import PreprocessingArtifacts
+from open_dubbing.utterance import Utterance
 
 
 class TestMain:
@@ -46,7 +56,7 @@ class TestMain:
             _get_selected_tts("cli", "", "", "cpu", None)
 
         assert excinfo.type is SystemExit
-        assert excinfo.value.code == 108
+        assert excinfo.value.code == int(ExitCode.NO_CLI_CFG_FILE)
 
     def test_get_selected_tts_api(self):
         tts = _get_selected_tts("api", "", "http://tts-server.com", "cpu", None)
@@ -59,6 +69,14 @@ class TestMain:
         assert excinfo.type is SystemExit
         assert excinfo.value.code == 110
 
+    def test_get_selected_tts_invalid(self):
+        with pytest.raises(ValueError):
+            _get_selected_tts("invalid", "", "", "cpu", None)
+
+    def test_get_selected_translator_invalid(self):
+        with pytest.raises(ValueError):
+            _get_selected_translator("invalid", "", "", "cpu")
+
     def test_get_selected_translator_apertium(self):
         tts = _get_selected_translator("apertium", "", "apertium_url", "cpu")
         assert "TranslationApertium" == type(tts).__name__
@@ -89,3 +107,69 @@ class TestMain:
 
         assert excinfo.type is SystemExit
         assert excinfo.value.code == 113
+
+    def test_check_fast_load_no_accelerate(self):
+        with pytest.raises(SystemExit) as excinfo, patch.dict(
+            sys.modules, {"accelerate": None}
+        ):
+            _check_fast_load()
+
+        assert excinfo.type is SystemExit
+        assert excinfo.value.code == 114
+
+    def test_configure_hf_cache(self):
+        with patch.dict(os.environ, {}, clear=True):
+            _configure_hf_cache("/scratch/hf")
+            assert os.environ["HF_HOME"] == os.path.abspath("/scratch/hf")
+            assert os.environ["HF_XET_HIGH_PERFORMANCE"] == "1"
+
+    def test_configure_hf_cache_not_defined(self):
+        with patch.dict(os.environ, {"HF_XET_HIGH_PERFORMANCE": "0"}, clear=True):
+            _configure_hf_cache("")
+            assert "HF_HOME" not in os.environ
+            assert os.environ["HF_XET_HIGH_PERFORMANCE"] == "0"
+
+    def test_get_language_names(self):
+        names = _get_language_names({"eng", "cat", "fra"})
+        assert names == ["Catalan", "English", "French"]
+
+    def test_configure_threads(self):
+        with patch.dict(os.environ, {}, clear=True), patch(
+            "torch.set_num_threads"
+        ) as mock_set_num_threads, patch(
+            "torch.set_num_interop_threads"
+        ) as mock_set_num_interop_threads:
+            _configure_threads(4)
+            mock_set_num_threads.assert_called_once_with(4)
+            mock_set_num_interop_threads.assert_called_once_with(1)
+            assert os.environ["OMP_NUM_THREADS"] == "4"
+            expected = "false" if sys.platform == "darwin" else "true"
+            assert os.environ["TOKENIZERS_PARALLELISM"] == expected
+
+    def test_configure_threads_not_defined(self):
+        with patch.dict(os.environ, {}, clear=True), patch(
+            "torch.set_num_threads"
+        ) as mock_set_num_threads, patch(
+            "torch.set_num_interop_threads"
+        ) as mock_set_num_interop_threads:
+            _configure_threads(0)
+            mock_set_num_threads.assert_not_called()
+            mock_set_num_interop_threads.assert_not_called()
+            assert "OMP_NUM_THREADS" not in os.environ
+
+    def test_get_previous_source_language(self):
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            assert "" == _get_previous_source_language("cat", temporary_directory)
+
+            Utterance("cat", temporary_directory).save_utterances(
+                utterance_metadata=[{"start": 1.0, "end": 2.0}],
+                preprocessing_output=PreprocessingArtifacts(
+                    video_file="video.mp4",
+                    audio_file="audio.mp3",
+                    audio_vocals_file="vocals.mp3",
+                    audio_background_file="background.mp3",
+                ),
+                metadata={"source_language": "eng"},
+            )
+            language = _get_previous_source_language("cat", temporary_directory)
+            assert "eng" == language
@@ -14,6 +14,11 @@
 
 import os
 
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
 from open_dubbing.speech_to_text_faster_whisper import SpeechToTextFasterWhisper
 
 
@@ -27,6 +32,14 @@ class TestTextToSpeechFasterWhisper:
         text = stt._transcribe(vocals_filepath=filename, source_language_iso_639_1="en")
         assert text.strip() == "This is a test."
 
+    def test_transcribe_batched(self):
+        data_dir = os.path.dirname(os.path.realpath(__file__))
+        filename = os.path.join(data_dir, "data/this_is_a_test.mp3")
+        stt = SpeechToTextFasterWhisper(batch_size=8)
+        stt.load_model()
+        text = stt._transcribe(vocals_filepath=filename, source_language_iso_639_1="en")
+        assert text.strip() == "This is a test."
+
     def test_detect_language(self):
         data_dir = os.path.dirname(os.path.realpath(__file__))
         filename = os.path.join(data_dir, "data/this_is_a_test.mp3")
@@ -41,3 +54,47 @@ class TestTextToSpeechFasterWhisper:
         languages = stt.get_languages()
         assert len(languages) == 100
         assert "eng" in languages
+
+    def test_transcribe_batched_without_vad(self):
+        stt = SpeechToTextFasterWhisper(batch_size=8)
+        stt.model = MagicMock()
+        stt.model.feature_extractor.chunk_length = 30
+        stt.model.feature_extractor.sampling_rate = 16000
+        stt._batched_model = MagicMock()
+        stt._batched_model.transcribe.return_value = [], None
+        audio = np.zeros(16000 * 70, dtype=np.float32)
+
+        stt._transcribe_batched(audio, "en")
+
+        stt._batched_model.transcribe.assert_called_once_with(
+            audio,
+            "en",
+            vad_filter=False,
+            batch_size=8,
+            clip_timestamps=[
+                {"start": 0, "end": 480000},
+                {"start": 480000, "end": 960000},
+                {"start": 960000, "end": 1120000},
+            ],
+        )
+
+    def test_get_languages_computed_once(self):
+        stt = SpeechToTextFasterWhisper()
+        stt.model = MagicMock(supported_languages=["ca", "en"])
+
+        languages = stt.get_languages()
+        stt.model.supported_languages = []
+        assert languages is stt.get_languages()
+        assert languages == ["cat", "eng"]
+
+    @pytest.mark.parametrize(
+        "device, compute_type, expected",
+        [
+            ("cpu", None, "int8"),
+            ("cuda", None, "int8_float16"),
+            ("cuda", "float16", "float16"),
+        ],
+    )
+    def test_get_compute_type(self, device, compute_type, expected):
+        stt = SpeechToTextFasterWhisper(device=device, compute_type=compute_type)
+        assert stt._get_compute_type() == expected
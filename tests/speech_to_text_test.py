@@ -104,6 +104,40 @@ class TestTranscribe:
         assert transcribed_audio_chunks[0]["text"] == ""
         assert not transcribed_audio_chunks[0]["for_dubbing"]
 
+    def test_transcribe_chunks_packed(self):
+        mock_model = MagicMock(spec=WhisperModel)
+        Segment = namedtuple("Segment", ["words"])
+        Word = namedtuple("Word", ["start", "end", "word"])
+        # Each utterance is followed by 1 sec of silence in the packed audio
+        mock_model.transcribe.return_value = [
+            Segment(words=[Word(0.5, 1.0, " Hello"), Word(1.2, 2.0, " world.")]),
+            Segment(words=[Word(6.2, 7.0, " Bye.")]),
+        ], None
+        utterance_metadata = [
+            dict(path=self.silence_audio.name, start=0.0, end=5.0),
+            dict(path=self.silence_audio.name, start=6.0, end=11.0),
+            dict(path=self.silence_audio.name, start=12.0, end=17.0),
+        ]
+        spt = SpeechToTextFasterWhisper(pack_utterances=True)
+        spt.model = mock_model
+        transcribed_audio_chunks = spt.transcribe_audio_chunks(
+            utterance_metadata=utterance_metadata,
+            source_language="eng",
+            no_dubbing_phrases=[],
+        )
+
+        assert mock_model.transcribe.call_count == 1
+        assert [chunk["text"] for chunk in transcribed_audio_chunks] == [
+            "Hello world.",
+            "Bye.",
+            "",
+        ]
+        assert [chunk["for_dubbing"] for chunk in transcribed_audio_chunks] == [
+            True,
+            True,
+            False,
+        ]
+
 
 class TestAddSpeakerInfo:
 
@@ -14,6 +14,11 @@
 
 import os
 
+from unittest.mock import patch
+
+import pytest
+import torch
+
 from open_dubbing.speech_to_text_whisper_transformers import (
     SpeechToTextWhisperTransformers,
 )
@@ -44,3 +49,39 @@ class TestSpeechToTextWhisperTransformers:
         languages = stt.get_languages()
         assert len(languages) == 100
         assert "eng" in languages
+
+    @pytest.mark.parametrize(
+        "bf16_supported, expected_dtype",
+        [
+            (True, torch.bfloat16),
+            (False, torch.float16),
+        ],
+    )
+    def test_load_model_cuda_dtype(self, bf16_supported, expected_dtype):
+        module = "open_dubbing.speech_to_text_whisper_transformers"
+        with patch(f"{module}.WhisperProcessor"), patch(
+            f"{module}.WhisperForConditionalGeneration"
+        ) as mock_model, patch(
+            "torch.cuda.is_bf16_supported", return_value=bf16_supported
+        ):
+            stt = SpeechToTextWhisperTransformers(device="cuda")
+            stt.load_model()
+
+        mock_model.from_pretrained.assert_called_once_with(
+            "openai/whisper-medium", torch_dtype=expected_dtype
+        )
+        mock_model.from_pretrained.return_value.to.assert_called_once_with("cuda")
+
+    def test_load_model_fast_load(self):
+        module = "open_dubbing.speech_to_text_whisper_transformers"
+        with patch(f"{module}.WhisperProcessor"), patch(
+            f"{module}.WhisperForConditionalGeneration"
+        ) as mock_model:
+            stt = SpeechToTextWhisperTransformers(fast_load=True)
+            stt.load_model()
+
+        mock_model.from_pretrained.assert_called_once_with(
+            "openai/whisper-medium", low_cpu_mem_usage=True, device_map="cpu"
+        )
+        mock_model.from_pretrained.return_value.to.assert_not_called()
+        assert stt._model == mock_model.from_pretrained.return_value
@@ -26,7 +26,7 @@ class MockResponse:
 
 
 class TestTextToSpeechAPI:
-    # Mock response class to simulate requests.get
+    # Mock response class to simulate requests.Session.get
 
     # Mock voices data that would be returned by the server
     mock_voices_data = [
@@ -54,7 +54,7 @@ class TestTextToSpeechAPI:
     # Path to a real .wav file that exists on your disk for testing
     WAV_FILE_PATH = "/path/to/your/test.wav"
 
-    @mock.patch("requests.get")
+    @mock.patch("requests.Session.get")
     @mock.patch.object(TextToSpeechAPI, "_convert_to_mp3")
     def test_convert_text_to_speech(self, mock_convert_to_mp3, mock_requests_get):
         tts_api = TextToSpeechAPI(server="http://dummyserver.com")
@@ -71,7 +71,7 @@ class TestTextToSpeechAPI:
             speed=1.0,
         )
 
-        # Ensure requests.get was called with the correct URL
+        # Ensure requests.Session.get was called with the correct URL
         expected_url = (
             "http://dummyserver.com/speak?voice=test_voice&text=Hello, world!"
         )
@@ -79,7 +79,7 @@ class TestTextToSpeechAPI:
         assert mock_convert_to_mp3.called
 
     @mock.patch("time.sleep", return_value=None)
-    @mock.patch("requests.get")
+    @mock.patch("requests.Session.get")
     @mock.patch.object(TextToSpeechAPI, "_convert_to_mp3")
     def test_convert_text_to_speech_with_one_retry(
         self, mock_convert_to_mp3, mock_requests_get, _
@@ -99,10 +99,18 @@ class TestTextToSpeechAPI:
             speed=1.0,
         )
 
-        # Ensure requests.get was called twice with the correct URL
+        # Ensure requests.Session.get was called twice with the correct URL
         expected_url = (
             "http://dummyserver.com/speak?voice=test_voice&text=Hello, world!"
         )
         assert mock_requests_get.call_count == 2
         mock_requests_get.assert_called_with(expected_url)
         assert mock_convert_to_mp3.called
+
+    def test_session_pool_size(self):
+        tts_api = TextToSpeechAPI(server="http://dummyserver.com")
+        tts_api.set_concurrency(4)
+
+        adapter = tts_api._session.get_adapter("http://dummyserver.com/speak")
+        assert adapter._pool_maxsize == 4
+        assert tts_api._session is tts_api._session
@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from unittest.mock import patch
+
 from open_dubbing.text_to_speech_mms import TextToSpeechMMS
 
 
@@ -26,3 +28,17 @@ class TestTextToSpeechMMS:
         api = TextToSpeechMMS()
         languages = api.get_languages()
         assert len(languages) == 1074
+
+    def test_get_model_and_tokenizer_loads_once(self):
+        with patch(
+            "open_dubbing.text_to_speech_mms.VitsModel.from_pretrained"
+        ) as mock_model, patch(
+            "open_dubbing.text_to_speech_mms.AutoTokenizer.from_pretrained"
+        ) as mock_tokenizer:
+            api = TextToSpeechMMS()
+            api._get_model_and_tokenizer("cat")
+            api._get_model_and_tokenizer("cat")
+            api._get_model_and_tokenizer("eng")
+
+            assert mock_model.call_count == 2
+            assert mock_tokenizer.call_count == 2
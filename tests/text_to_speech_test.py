@@ -273,6 +273,38 @@ class TestTextToSpeech:
             assert utterance_metadata[0] == result[0]
             assert expected_medata[0] == result[1]
 
+    def test_dub_utterances_concurrency_keeps_order(self):
+        tts = TextToSpeechUT()
+        tts.set_concurrency(4)
+
+        utterance_metadata = self._get_dub_metadata()
+        for idx, utterance in enumerate(utterance_metadata):
+            utterance["path"] = f"some/path/file_{idx}.mp3"
+
+        def _convert(*, output_filename, **kwargs):
+            return output_filename
+
+        with patch.object(
+            tts, "_supports_concurrency", return_value=True
+        ), patch.object(
+            tts,
+            "_convert_text_to_speech_without_end_silence",
+            side_effect=_convert,
+        ), patch.object(
+            tts, "_calculate_target_utterance_speed", return_value=1.0
+        ):
+            result = tts.dub_utterances(
+                utterance_metadata=utterance_metadata,
+                output_directory="/output",
+                target_language="eng",
+                audio_file="",
+            )
+
+            assert [utterance["dubbed_path"] for utterance in result] == [
+                "/output/dubbed_file_0.mp3",
+                "/output/dubbed_file_1.mp3",
+            ]
+
     @pytest.mark.parametrize(
         "test_name, utterance_metadata, expected_result",
         [
@@ -587,3 +619,13 @@ class TestTextToSpeech:
         )
 
         assert "Voice0" == updated_utterances[0]["assigned_voice"]
+
+    def test_get_audio_duration_decodes_once(self):
+        tts = TextToSpeechUT()
+        with patch(
+            "open_dubbing.text_to_speech.AudioSegment.from_mp3",
+            return_value=Mock(duration_seconds=4.0),
+        ) as mock_from_mp3:
+            assert tts._get_audio_duration("audio.mp3") == 4.0
+            assert tts._get_audio_duration("audio.mp3") == 4.0
+            mock_from_mp3.assert_called_once_with("audio.mp3")
@@ -12,8 +12,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import json
-
 from unittest.mock import MagicMock, patch
 
 from open_dubbing.translation_apertium import TranslationApertium
@@ -23,13 +21,11 @@ class TestTranslationApertium:
     def test_translate_text(self):
         translation_apertium = TranslationApertium()
 
-        with patch("urllib.request.urlopen") as mock_urlopen:
+        with patch("requests.Session.get") as mock_get:
             mock_response = MagicMock()
             expected_response = {"responseData": {"translatedText": "Hola món"}}
-            mock_response.read.return_value = json.dumps(expected_response).encode(
-                "utf-8"
-            )
-            mock_urlopen.return_value = mock_response
+            mock_response.json.return_value = expected_response
+            mock_get.return_value = mock_response
 
             # Test data
             source_language = "eng"
@@ -42,7 +38,7 @@ class TestTranslationApertium:
             )
 
             # Verify the correct URL is generated and check the translation result
-            mock_urlopen.assert_called_once_with(
+            mock_get.assert_called_once_with(
                 "http://fake-server/translate?q=Hello+World&langpair=eng|cat&markUnknown=no"
             )
             assert translated_text == "Hola món"
@@ -51,7 +47,7 @@ class TestTranslationApertium:
 
         translation_apertium = TranslationApertium()
 
-        with patch("urllib.request.urlopen") as mock_urlopen:
+        with patch("requests.Session.get") as mock_get:
             mock_response = MagicMock()
             expected_response = {
                 "responseData": [
@@ -59,15 +55,13 @@ class TestTranslationApertium:
                     {"sourceLanguage": "cat", "targetLanguage": "fra"},
                 ]
             }
-            mock_response.read.return_value = json.dumps(expected_response).encode(
-                "utf-8"
-            )
-            mock_urlopen.return_value = mock_response
+            mock_response.json.return_value = expected_response
+            mock_get.return_value = mock_response
 
             # Set the server and get the language pairs
             translation_apertium.set_server("http://fake-server/")
             language_pairs = translation_apertium.get_language_pairs()
 
             # Check that the correct URL is generated and assert the results
-            mock_urlopen.assert_called_once_with("http://fake-server/listPairs")
+            mock_get.assert_called_once_with("http://fake-server/listPairs")
             assert language_pairs == {("eng", "cat"), ("cat", "fra")}
@@ -12,6 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
+import tempfile
+
 from unittest.mock import MagicMock, patch
 
 from open_dubbing.translation_nllb import TranslationNLLB
@@ -66,3 +69,48 @@ class TestTranslationNLLB:
 
         assert len(pairs) == 6
         assert pairs == expected_pairs
+
+    def test_get_model_nllb_fast_cache(self):
+        with tempfile.TemporaryDirectory() as temporary_directory, patch(
+            "open_dubbing.translation_nllb.AutoModelForSeq2SeqLM.from_pretrained"
+        ) as mock_from_pretrained:
+            mock_model = MagicMock()
+            mock_model.save_pretrained.side_effect = lambda path, **kwargs: os.makedirs(
+                path
+            )
+            mock_from_pretrained.return_value.to.return_value = mock_model
+
+            translation = TranslationNLLB(fast_cache_dir=temporary_directory)
+            translation.model_name = "facebook/nllb-200-1.3B"
+            cached_model_path = translation._get_fast_cache_path()
+
+            assert mock_model == translation._get_model_nllb()
+            mock_from_pretrained.assert_called_once_with("facebook/nllb-200-1.3B")
+            assert os.path.isdir(cached_model_path)
+
+            mock_from_pretrained.reset_mock()
+            translation._get_model_nllb()
+            mock_from_pretrained.assert_called_once_with(cached_model_path)
+
+    def test_load_model_fast_load(self):
+        with patch(
+            "open_dubbing.translation_nllb.AutoModelForSeq2SeqLM.from_pretrained"
+        ) as mock_from_pretrained:
+            translation = TranslationNLLB(device="cuda", fast_load=True)
+            model = translation._load_model("facebook/nllb-200-1.3B")
+
+        mock_from_pretrained.assert_called_once_with(
+            "facebook/nllb-200-1.3B", low_cpu_mem_usage=True, device_map="cuda"
+        )
+        mock_from_pretrained.return_value.to.assert_not_called()
+        assert model == mock_from_pretrained.return_value
+
+    def test_get_language_pairs_computed_once(self):
+        translation = TranslationNLLB()
+        translation.tokenizer = MagicMock()
+        translation.tokenizer.additional_special_tokens = ["cat_Latn", "eng_Latn"]
+
+        pairs = translation.get_language_pairs()
+        translation.tokenizer.additional_special_tokens = []
+        assert pairs is translation.get_language_pairs()
+        assert pairs == {("cat", "eng"), ("eng", "cat")}
@@ -35,117 +35,15 @@ class TranslationUT(Translation):
 class TestTranslation:
 
     @pytest.mark.parametrize(
-        "test_name, utterance_metadata, expected_script",
+        "text, expected_translation",
         [
-            ("empty_input", [], "<BREAK><BREAK>"),
-            (
-                "single_utterance",
-                [
-                    {
-                        "text": "Hello, world!",
-                        "start": 0.0,
-                        "stop": 1.0,
-                        "speaker_id": "speaker1",
-                        "gender": "male",
-                    }
-                ],
-                "<BREAK>Hello, world!<BREAK>",
-            ),
-            (
-                "multiple_utterances",
-                [
-                    {
-                        "text": "This is",
-                        "start": 0.0,
-                        "stop": 1.0,
-                        "speaker_id": "speaker1",
-                        "gender": "male",
-                    },
-                    {
-                        "text": "a test.",
-                        "start": 1.0,
-                        "stop": 2.0,
-                        "speaker_id": "speaker2",
-                        "gender": "female",
-                    },
-                ],
-                "<BREAK>This is<BREAK>a test.<BREAK>",
-            ),
-            (
-                "empty_string",
-                [
-                    {
-                        "text": "This is",
-                        "start": 0.0,
-                        "stop": 1.0,
-                        "speaker_id": "speaker1",
-                        "gender": "male",
-                    },
-                    {
-                        "text": "",
-                        "start": 1.0,
-                        "stop": 2.0,
-                        "speaker_id": "speaker2",
-                        "gender": "female",
-                    },
-                ],
-                "<BREAK>This is<BREAK><BREAK>",
-            ),
+            (" Hello ", "Hello"),
+            ("", ""),
+            ("   ", ""),
         ],
     )
-    def test_generate_script(self, test_name, utterance_metadata, expected_script):
-        result = TranslationUT()._generate_script(utterance_metadata=utterance_metadata)
-        assert (
-            result == expected_script
-        ), f"Failed for {test_name}: expected {expected_script}, got {result}"
-
-    @pytest.mark.parametrize(
-        "utterance_metadata, translated_script, expected_translated_metadata",
-        [
-            (
-                [
-                    {
-                        "text": "Hello",
-                        "start": 0.0,
-                        "stop": 1.0,
-                        "speaker_id": "speaker1",
-                        "gender": "male",
-                    },
-                    {
-                        "text": "World",
-                        "start": 1.0,
-                        "stop": 2.0,
-                        "speaker_id": "speaker2",
-                        "gender": "female",
-                    },
-                ],
-                "Bonjour<BREAK>Le Monde",
-                [
-                    {
-                        "text": "Hello",
-                        "start": 0.0,
-                        "stop": 1.0,
-                        "speaker_id": "speaker1",
-                        "gender": "male",
-                        "translated_text": "Bonjour",
-                    },
-                    {
-                        "text": "World",
-                        "start": 1.0,
-                        "stop": 2.0,
-                        "speaker_id": "speaker2",
-                        "gender": "female",
-                        "translated_text": "Le Monde",
-                    },
-                ],
-            ),
-        ],
-    )
-    def test_add_translations(
-        self, utterance_metadata, translated_script, expected_translated_metadata
-    ):
-        updated_metadata = TranslationUT()._add_translations(
-            utterance_metadata=utterance_metadata,
-            translated_script=translated_script,
+    def test_translate_text(self, text, expected_translation):
+        translation = TranslationUT().translate_text(
+            text=text, source_language="eng", target_language="cat"
         )
-        assert updated_metadata == expected_translated_metadata
+        assert translation == expected_translation